@@ -8,7 +8,6 @@ from typing import (
     Type,
 )
 
-import orjson
 from pydantic import BaseModel, ValidationError
 
 from mkfst.models import HTML, Body, Cookies, FileUpload, Headers, Parameters, Query
@@ -47,7 +46,7 @@ class Fabricator:
 
     def __init__(
         self,
-        required_params: List[
+        required_params: Tuple[
             Tuple[
                 str, 
                 Headers 
@@ -57,7 +56,8 @@ class Fabricator:
                 | HTML 
                 | FileUpload 
                 | Cookies,
-            ]
+            ],
+            ...
         ],
         optional_params: Dict[
             str, 
@@ -606,32 +606,37 @@ class Fabricator:
 
         try:
 
-            match self._body_key:
+            match self._body_type:
 
+                # File and HTML bodies are built from bytes/str we just
+                # read off the wire, so there's nothing for pydantic's
+                # strict type validators to check.
                 case 'file':
-                    body = annotation(
+                    body = annotation.model_construct(
                         data=b''.join(
                             data[data_line_idx:]
-                        ).strip(),
-                        content_type=headers.get('content-type'),
-                        content_encoding=headers.get('content-encoding')
+                        ),
+                        # Header keys are normalized to field names, and
+                        # Content-Encoding isn't a charset, so it's not
+                        # passed as the upload's encoding.
+                        content_type=headers.get('content_type'),
                     )
 
                 case 'html':
-                    body = annotation(
+                    body = annotation.model_construct(
                         content=b''.join(
                             data[data_line_idx:]
                         ).strip().decode()
                     )
 
                 case 'model':
-                    body = annotation(
-                        **orjson.loads(
-                            Body.make(
-                                data,
-                                data_line_idx,
-                            )
-                        )
+                    # Let pydantic-core parse the JSON straight into the
+                    # model rather than decoding to a dict first.
+                    body = annotation.model_validate_json(
+                        Body.make(
+                            data,
+                            data_line_idx,
+                        ).content
                     )
 
                 case _:
@@ -684,7 +689,7 @@ class Fabricator:
     ):
         try:
             annotation: Type[Parameters] = self._get_annotation(self._params_key, self._params_key_type)
-            parameters = annotation(**params)
+            parameters = annotation.model_validate(params)
 
             return (
                 parameters,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import ipaddress
+import os
 import re
 import socket
 from collections import defaultdict, deque
@@ -16,6 +18,7 @@ from mkfst.env import Env
 from mkfst.logging import Logger, LogLevel
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.models.http import (
+    FileUpload,
     HTTPResponse,
     parse_response,
 )
@@ -28,6 +31,10 @@ from .router import Router
 
 Handler = Callable[..., Tuple[Any, int]]
 
+# Clients send many requests from the same address, so parse each
+# peer's address once rather than on every rate limited request.
+parse_ip_address = functools.lru_cache(maxsize=4096)(ipaddress.ip_address)
+
 
 class MercurySyncHTTPConnection(MercurySyncTCPConnection):
     def __init__(
@@ -214,7 +221,7 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
                     ))
 
                     rejected = await self._limiter.limit(
-                        ipaddress.ip_address(ip_address),
+                        parse_ip_address(ip_address),
                         path,
                         method,
                         limit=handler.limit,
@@ -413,7 +420,12 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
                         message=f'Request - {method} {path}:{ip_address} - completed  route handler execution with middleware'
                     ))
 
-                    response_headers.update(context.response_headers)
+                    # Merge into a copy so per-request headers set by
+                    # middleware don't leak into the handler's shared headers.
+                    response_headers = {
+                        **response_headers,
+                        **context.response_headers,
+                    }
                     status_code = context.status or status_code
 
                 else:
@@ -430,16 +442,74 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
                         message=f'Request - {method} {path}:{ip_address} - completed route handler execution'
                     ))
 
-                if response_parser:
+                sendfile_upload: FileUpload | None = None
+
+                if (
+                    isinstance(response_data, FileUpload)
+                    and response_data.path is not None
+                    and self._use_encryption is False
+                ):
+                    # Send the head now and stream the file body
+                    # straight to the socket once it's written.
+                    sendfile_upload = response_data
+                    encoded_data = b''
+                    content_length = await asyncio.to_thread(
+                        os.path.getsize,
+                        sendfile_upload.path,
+                    )
+                    headers = f"content-length: {content_length}"
+
+                    if sendfile_upload.content_type:
+                        # The upload knows its own type, which is more
+                        # specific than the route's declared (or default
+                        # octet-stream) content-type.
+                        response_headers = {
+                            key: value
+                            for key, value in response_headers.items()
+                            if key.lower() != 'content-type'
+                        }
+                        response_headers['content-type'] = sendfile_upload.content_type
+
+                    await ctx.log(Event(
+                        level=LogLevel.DEBUG,
+                        message=f'Request - {method} {path}:{ip_address} - set file response body as {content_length} bytes via sendfile'
+                    ))
+
+                elif isinstance(response_data, (bytes, bytearray)):
+                    # Middleware (i.e. compression) has already produced
+                    # the wire-ready body, so send it as-is.
+                    encoded_data = response_data
+                    content_length = len(encoded_data)
+                    headers = f"content-length: {content_length}"
+
+                    await ctx.log(Event(
+                        level=LogLevel.DEBUG,
+                        message=f'Request - {method} {path}:{ip_address} - set binary response body as {content_length} bytes'
+                    ))
+
+                elif response_parser:
                     await ctx.log(Event(
                         level=LogLevel.DEBUG,
                         message=f'Request - {method} {path}:{ip_address} - serializing response body'
                     ))
 
-                    encoded_data = parse_response(
-                        response_data, 
-                        response_parser
-                    )
+                    if (
+                        isinstance(response_data, FileUpload)
+                        and response_data.path is not None
+                    ):
+                        # Encrypted responses read path-backed uploads
+                        # into memory, so keep that read off the loop.
+                        encoded_data = await asyncio.to_thread(
+                            parse_response,
+                            response_data,
+                            response_parser,
+                        )
+
+                    else:
+                        encoded_data = parse_response(
+                            response_data, 
+                            response_parser
+                        )
                     content_length = len(encoded_data)
                     headers = f"content-length: {content_length}"
 
@@ -476,9 +546,15 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
                         message=f'Request - {method} {path}:{ip_address} - response adding header - {key}:{response_headers[key]}'
                     ))
 
-                response_data = (
-                    f"HTTP/1.1 {status_code} OK\r\n{headers}\r\n\r\n{encoded_data}".encode()
-                )
+                if isinstance(encoded_data, (bytes, bytearray)):
+                    response_data = (
+                        f"HTTP/1.1 {status_code} OK\r\n{headers}\r\n\r\n".encode() + encoded_data
+                    )
+
+                else:
+                    response_data = (
+                        f"HTTP/1.1 {status_code} OK\r\n{headers}\r\n\r\n{encoded_data}".encode()
+                    )
 
                 if self._use_encryption:
                     encrypted_data = self._encryptor.encrypt(response_data)
@@ -497,6 +573,9 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
                 
                 transport.write(response_data)
 
+                if sendfile_upload is not None:
+                    await sendfile_upload.sendfile_to(transport)
+
             except KeyError:
                 if self._supported_handlers.get(path) is None:
                     not_found_response = HTTPResponse(
@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import (
     Any,
@@ -72,6 +73,14 @@ ParamType = (
     | type[Query]
 )
 
+@functools.lru_cache(maxsize=1024)
+def get_model_json_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    # A model's schema never changes, but it's requested for every
+    # endpoint and method that uses it - and the error models are
+    # documented on every endpoint. Callers must copy before mutating.
+    return model.model_json_schema(ref_template=REF_TEMPLATE)
+
+
 def parse_type(field: FieldMetadata) -> List[str] | str:
     field_data: List[FieldType] = field.get("anyOf")
     if field_data:
@@ -266,8 +275,8 @@ class EndpointParser:
                             "format": "file",
                             "contentMediaType": content_type,
                             "contentEncoding": encoding,
-                            "examples": self.body.model_json_schema(
-                                ref_template=REF_TEMPLATE
+                            "examples": get_model_json_schema(
+                                self.body
                             ).get("examples")
                         },
                     }
@@ -289,8 +298,8 @@ class EndpointParser:
                             "format": "html",
                             "contentMediaType": "text/html",
                             "contentEncoding": "utf-8",
-                            "examples": self.body.model_json_schema(
-                                ref_template=REF_TEMPLATE
+                            "examples": get_model_json_schema(
+                                self.body
                             ).get("examples")
                         },
                     }
@@ -302,7 +311,7 @@ class EndpointParser:
         
         elif self.body in BaseModel.__subclasses__() or self.body in RootModel.__subclasses__():
 
-            body_schema = self.body.model_json_schema(ref_template=REF_TEMPLATE)
+            body_schema = dict(get_model_json_schema(self.body))
 
             if content_type is None:
                 content_type = "application/json"
@@ -481,8 +490,8 @@ class EndpointParser:
                         "format": "html",
                         "contentMediaType": "text/html",
                         "contentEncoding": "utf-8",
-                        "examples": response.model_json_schema(
-                            ref_template=REF_TEMPLATE,
+                        "examples": get_model_json_schema(
+                            response,
                         ).get("examples")
                     },
                 }
@@ -493,7 +502,7 @@ class EndpointParser:
         
         elif response in BaseModel.__subclasses__() or response in RootModel.__subclasses__():
 
-            response_schema = response.model_json_schema(ref_template=REF_TEMPLATE)
+            response_schema = dict(get_model_json_schema(response))
 
             if content_type is None:
                 content_type = "application/json"
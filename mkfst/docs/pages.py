@@ -155,7 +155,7 @@ def get_swagger_ui_html(
     </body>
     </html>
     """
-    return HTML(content=html)
+    return HTML.model_construct(content=html)
 
 
 def get_redoc_html(
@@ -250,7 +250,7 @@ def get_redoc_html(
     </body>
     </html>
     """
-    return HTML(content=html)
+    return HTML.model_construct(content=html)
 
 
 def get_swagger_ui_oauth2_redirect_html() -> HTML:
@@ -341,4 +341,4 @@ def get_swagger_ui_oauth2_redirect_html() -> HTML:
     </body>
     </html>
         """
-    return HTML(content=html)
+    return HTML.model_construct(content=html)
@@ -1,17 +1,50 @@
-from typing import Any, Dict
+import functools
+import string
+from typing import Any, Dict, Tuple
 
 import msgspec
 
 from .log_level import LogLevel
 
+_formatter = string.Formatter()
+
+LOG_LEVEL_NAMES: Dict[LogLevel, str] = {
+    level: level.value for level in LogLevel
+}
+
+
+@functools.lru_cache(maxsize=256)
+def template_fields(template: str) -> Tuple[str, ...]:
+    # Loggers reuse a handful of templates, so parse each one once and
+    # only look up the fields it actually references.
+    fields: Dict[str, None] = {}
+    for _, field_name, _, _ in _formatter.parse(template):
+        if field_name:
+            fields[field_name.partition(".")[0].partition("[")[0]] = None
+
+    return tuple(fields)
+
 
 class Entry(msgspec.Struct, kw_only=True):
     message: str | None = None
+    message_args: tuple | None = None
     tags: set[str] = msgspec.field(
         default_factory=set,
     )
     level: LogLevel
 
+    def _template_value(self, field: str) -> Any:
+        if field == "level":
+            return LOG_LEVEL_NAMES[self.level]
+
+        # Entries below the configured level never get here, so
+        # %-style message arguments are only interpolated when the
+        # entry is actually written.
+        elif field == "message" and self.message_args:
+            return self.message % self.message_args
+
+        return getattr(self, field)
+
     def to_template(
         self,
         template: str,
@@ -20,11 +53,13 @@ class Entry(msgspec.Struct, kw_only=True):
         kwargs: Dict[
             str,
             int | str | bool | float | LogLevel | list | dict | set | Any,
-        ] = {field: getattr(self, field) for field in self.__struct_fields__}
+        ] = {}
 
-        kwargs["level"] = kwargs["level"].value
+        for field in template_fields(template):
+            if context and field in context:
+                kwargs[field] = context[field]
 
-        if context:
-            kwargs.update(context)
+            else:
+                kwargs[field] = self._template_value(field)
 
-        return template.format(**kwargs)
+        return template.format_map(kwargs)
@@ -11,7 +11,8 @@ from typing import (
     TypeVar,
 )
 
-from mkfst.logging.models import Entry, Log
+from mkfst.logging.config.logging_config import LoggingConfig
+from mkfst.logging.models import Entry, Log, LogLevel
 
 from .logger_context import LoggerContext
 from .retention_policy import RetentionPolicyConfig
@@ -23,6 +24,7 @@ class Logger:
     def __init__(self) -> None:
         self._contexts: Dict[str, LoggerContext] = {}
         self._watch_tasks: Dict[str, asyncio.Task] = {}
+        self._config = LoggingConfig()
 
     def __getitem__(self, name: str):
 
@@ -31,6 +33,16 @@ class Logger:
 
         return self._contexts[name]
 
+    def enabled(
+        self,
+        level: LogLevel,
+        name: str | None = None,
+    ) -> bool:
+        if name is None:
+            name = 'default'
+
+        return self._config.enabled(name, level)
+
     def context(
         self,
         name: str | None = None,
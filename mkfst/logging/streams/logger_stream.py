@@ -8,6 +8,7 @@ import threading
 import uuid
 from collections import defaultdict
 from typing import (
+    Any,
     Callable,
     Dict,
     List,
@@ -35,6 +36,21 @@ from .stream_type import StreamType
 
 T = TypeVar('T', bound=Entry)
 
+# Encoders are safe to share between threads, so every stream reuses
+# one rather than msgspec.json.encode() setting one up per entry.
+log_encoder = msgspec.json.Encoder()
+
+DEFAULT_TEMPLATE = "{timestamp} - {level} - {thread_id} - {filename}:{function_name}.{line_number} - {message}"
+ERROR_TEMPLATE = "{timestamp} - {level} - {thread_id}.{filename}:{function_name}.{line_number} - {error}"
+
+# Errors go to stdout along with debug and info output; everything
+# else is written to stderr.
+STDOUT_LEVELS = frozenset({
+    LogLevel.DEBUG,
+    LogLevel.INFO,
+    LogLevel.ERROR,
+})
+
 
 def patch_transport_close(
     transport: asyncio.Transport, 
@@ -383,18 +399,15 @@ class LoggerStream:
 
         return logfile_path
 
-    async def log(
+    def _resolve_target(
         self,
-        entry: T,
         template: str | None = None,
         path: str | None = None,
         retention_policy: RetentionPolicyConfig | None = None,
-        filter: Callable[[T], bool] | None=None,
-):
+    ):
         filename: str | None = None
         directory: str | None = None
 
-
         if path:
             logfile_path = pathlib.Path(path)
             is_logfile = len(logfile_path.suffix) > 0 
@@ -403,7 +416,7 @@ class LoggerStream:
             directory = str(logfile_path.parent.absolute()) if is_logfile else str(logfile_path.absolute())
 
         if template is None:
-            template = self._default_template
+            template = self._default_template or DEFAULT_TEMPLATE
         
         if filename is None:
             filename = self._default_logfile
@@ -414,6 +427,32 @@ class LoggerStream:
         if retention_policy is None:
             retention_policy = self._default_retention_policy
 
+        return (
+            template,
+            filename,
+            directory,
+            retention_policy,
+        )
+
+    async def log(
+        self,
+        entry: T,
+        template: str | None = None,
+        path: str | None = None,
+        retention_policy: RetentionPolicyConfig | None = None,
+        filter: Callable[[T], bool] | None=None,
+):
+        (
+            template,
+            filename,
+            directory,
+            retention_policy,
+        ) = self._resolve_target(
+            template=template,
+            path=path,
+            retention_policy=retention_policy,
+        )
+
         if filename or directory:
             await self._log_to_file(
                 entry,
@@ -430,48 +469,179 @@ class LoggerStream:
                 filter=filter,
             )
 
-    async def _log(
+    async def log_batch(
         self,
-        entry_or_log: T | Log[T],
+        entries: List[T],
         template: str | None = None,
+        path: str | None = None,
+        retention_policy: RetentionPolicyConfig | None = None,
         filter: Callable[[T], bool] | None=None,
     ):
+        (
+            template,
+            filename,
+            directory,
+            retention_policy,
+        ) = self._resolve_target(
+            template=template,
+            path=path,
+            retention_policy=retention_policy,
+        )
 
-        entry: Entry = None
-        if isinstance(entry_or_log, Log):
-            entry = entry_or_log.entry
+        if filename or directory:
+            await self._log_batch_to_file(
+                entries,
+                filename=filename,
+                directory=directory,
+                retention_policy=retention_policy,
+                filter=filter,
+            )
 
         else:
-            entry = entry_or_log
+            await self._log_batch(
+                entries,
+                template=template,
+                filter=filter,
+            )
+
+    def _should_log(
+        self,
+        entry: Entry,
+        filter: Callable[[T], bool] | None=None,
+    ):
+        return self._config.enabled(self._name, entry.level) and (
+            filter is None or filter(entry) is not False
+        )
 
-        stream = (
+    def _get_stream_type(self, entry: Entry):
+        return (
             StreamType.STDOUT
-            if entry.level
-            in [
-                LogLevel.DEBUG,
-                LogLevel.INFO,
-                LogLevel.ERROR,
-            ]
+            if entry.level in STDOUT_LEVELS
             else StreamType.STDERR
         )
 
-        if self._config.enabled(self._name, entry.level) is False:
+    def _get_template_context(
+        self,
+        log_file: str,
+        function_name: str,
+        line_number: int,
+    ):
+        return {
+            "filename": log_file,
+            "function_name": function_name,
+            "line_number": line_number,
+            "thread_id": threading.get_native_id(),
+            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+        }
+
+    def _render(
+        self,
+        entry: Entry,
+        template: str,
+        context: Dict[str, Any],
+    ):
+        return entry.to_template(
+            template,
+            context=context,
+        ).encode() + b"\n"
+
+    async def _write_error(
+        self,
+        entry: Entry,
+        error: Exception,
+        context: Dict[str, Any],
+    ):
+        if self._stderr.closed is False:
+            await asyncio.to_thread(
+                self._stderr.write,
+                entry.to_template(
+                    ERROR_TEMPLATE,
+                    context={
+                        **context,
+                        "error": str(error),
+                    },
+                ) + "\n",
+            )
+
+    async def _log_batch(
+        self,
+        entries: List[T],
+        template: str = DEFAULT_TEMPLATE,
+        filter: Callable[[T], bool] | None=None,
+    ):
+        entries = [
+            entry for entry in entries
+            if self._should_log(entry, filter=filter)
+        ]
+
+        if len(entries) < 1:
             return
-    
-        if filter and filter(entry) is False:
+
+        if self._initialized is None:
+            await self.initialize()
+
+        log_file, line_number, function_name = self._find_caller()
+        context = self._get_template_context(
+            log_file,
+            function_name,
+            line_number,
+        )
+
+        # Group the batch by stream so each stream's lines are written
+        # in one go and the whole batch costs a single drain per stream.
+        batches: Dict[StreamType, List[Entry]] = defaultdict(list)
+        for entry in entries:
+            batches[self._get_stream_type(entry)].append(entry)
+
+        for stream, stream_entries in batches.items():
+            stream_writer = self._stream_writers[stream]
+
+            if stream_writer.is_closing():
+                continue
+
+            try:
+                stream_writer.writelines([
+                    self._render(
+                        entry,
+                        template,
+                        context,
+                    ) for entry in stream_entries
+                ])
+
+                await stream_writer.drain()
+
+            except Exception as err:
+                await self._write_error(
+                    stream_entries[-1],
+                    err,
+                    context,
+                )
+
+    async def _log(
+        self,
+        entry_or_log: T | Log[T],
+        template: str = DEFAULT_TEMPLATE,
+        filter: Callable[[T], bool] | None=None,
+    ):
+
+        entry: Entry = None
+        if isinstance(entry_or_log, Log):
+            entry = entry_or_log.entry
+
+        else:
+            entry = entry_or_log
+
+        if not self._should_log(entry, filter=filter):
             return
 
         if self._initialized is None:
             await self.initialize()
 
-        stream_writer = self._stream_writers[stream]
+        stream_writer = self._stream_writers[self._get_stream_type(entry)]
 
         if stream_writer.is_closing():
             return
 
-        if template is None:
-            template = "{timestamp} - {level} - {thread_id} - {filename}:{function_name}.{line_number} - {message}"
-
         if isinstance(entry_or_log, Log):
             log_file = entry_or_log.filename
             line_number = entry_or_log.line_number
@@ -480,41 +650,29 @@ class LoggerStream:
         else:
             log_file, line_number, function_name = self._find_caller()
 
+        context = self._get_template_context(
+            log_file,
+            function_name,
+            line_number,
+        )
+
         try:
             stream_writer.write(
-                entry.to_template(
+                self._render(
+                    entry,
                     template,
-                    context={
-                        "filename": log_file,
-                        "function_name": function_name,
-                        "line_number": line_number,
-                        "thread_id": threading.get_native_id(),
-                        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
-                    },
-                ).encode()
-                + b"\n"
+                    context,
+                )
             )
             
             await stream_writer.drain()
 
         except Exception as err:
-            error_template = "{timestamp} - {level} - {thread_id}.{filename}:{function_name}.{line_number} - {error}"
-            
-            if self._stderr.closed is False:
-                await asyncio.to_thread(
-                    self._stderr.write,
-                    entry.to_template(
-                        error_template,
-                        context={
-                            "filename": log_file,
-                            "function_name": function_name,
-                            "line_number": line_number,
-                            "error": str(err),
-                            "thread_id": threading.get_native_id(),
-                            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
-                        },
-                    ),
-                )
+            await self._write_error(
+                entry,
+                err,
+                context,
+            )
 
     async def _log_to_file(
         self,
@@ -532,12 +690,68 @@ class LoggerStream:
         else:
             entry = entry_or_log
 
-        if self._config.enabled(self._name, entry.level) is False:
+        if not self._should_log(entry, filter=filter):
             return
 
-        if filter and  filter(entry) is False:
+        if isinstance(entry_or_log, Log):
+            log = entry_or_log
+
+        else:
+            log_file, line_number, function_name = self._find_caller()
+
+            log = Log(
+                entry=entry,
+                filename=log_file,
+                function_name=function_name,
+                line_number=line_number
+            )
+
+        await self._write_logs(
+            [log],
+            filename=filename,
+            directory=directory,
+            retention_policy=retention_policy,
+        )
+
+    async def _log_batch_to_file(
+        self,
+        entries: List[T],
+        filename: str | None = None,
+        directory: str | None = None,
+        retention_policy: RetentionPolicyConfig | None = None,
+        filter: Callable[[T], bool] | None=None,
+    ):
+        entries = [
+            entry for entry in entries
+            if self._should_log(entry, filter=filter)
+        ]
+
+        if len(entries) < 1:
             return
-        
+
+        log_file, line_number, function_name = self._find_caller()
+
+        await self._write_logs(
+            [
+                Log(
+                    entry=entry,
+                    filename=log_file,
+                    function_name=function_name,
+                    line_number=line_number
+                ) for entry in entries
+            ],
+            filename=filename,
+            directory=directory,
+            retention_policy=retention_policy,
+        )
+
+    async def _write_logs(
+        self,
+        logs: List[Log[T]],
+        filename: str | None = None,
+        directory: str | None = None,
+        retention_policy: RetentionPolicyConfig | None = None,
+    ):
         if self._cwd is None:
             self._cwd = await asyncio.to_thread(os.getcwd)
 
@@ -570,29 +784,14 @@ class LoggerStream:
                 retention_policy,
             )
 
-        if isinstance(entry_or_log, Log):
-            log_file = entry_or_log.filename
-            line_number = entry_or_log.line_number
-            function_name = entry_or_log.function_name
-
-            log = entry_or_log
-
-        else:
-            log_file, line_number, function_name = self._find_caller()
-
-            log = Log(
-                entry=entry,
-                filename=log_file,
-                function_name=function_name,
-                line_number=line_number
-            )
-
         try:
             await self._file_locks[logfile_path].acquire()
 
+            # The whole batch goes to the file in a single worker
+            # thread hop.
             await asyncio.to_thread(
                 self._write_to_file,
-                log,
+                logs,
                 logfile_path,
             )
 
@@ -601,27 +800,21 @@ class LoggerStream:
             self._file_locks[logfile_path].release()
 
         except Exception as err:
-            error_template = "{timestamp} - {level} - {thread_id}.{filename}:{function_name}.{line_number} - {error}"
-
-            if self._stderr.closed is False:
-                await asyncio.to_thread(
-                    self._stderr.write,
-                    entry.to_template(
-                        error_template,
-                        context={
-                            "filename": log_file,
-                            "function_name": function_name,
-                            "line_number": line_number,
-                            "error": str(err),
-                            "thread_id": threading.get_native_id(),
-                            "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
-                        },
-                    ),
-                )
+            log = logs[-1]
+
+            await self._write_error(
+                log.entry,
+                err,
+                self._get_template_context(
+                    log.filename,
+                    log.function_name,
+                    log.line_number,
+                ),
+            )
 
     def _write_to_file(
         self,
-        entry: Entry,
+        logs: List[Log],
         logfile_path: str,
     ):
         if (
@@ -629,8 +822,21 @@ class LoggerStream:
         ) and (
             logfile.closed is False
         ):
-            
-            logfile.write(msgspec.json.encode(entry) + b"\n")
+            lines: List[bytes] = []
+            for log in logs:
+                if log.entry.message_args:
+                    log = msgspec.structs.replace(
+                        log,
+                        entry=msgspec.structs.replace(
+                            log.entry,
+                            message=log.entry.message % log.entry.message_args,
+                            message_args=None,
+                        ),
+                    )
+
+                lines.append(log_encoder.encode(log) + b"\n")
+
+            logfile.writelines(lines)
 
     def _find_caller(self):
         """
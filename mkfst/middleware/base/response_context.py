@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -13,6 +14,12 @@ from mkfst.connection.tcp.fabricator import Fabricator
 from mkfst.models.http.request_models import Cookies, Headers
 
 
+@lru_cache(maxsize=256)
+def to_header_field(name: str) -> str:
+    # Headers.make() stores "X-Some-Header" as the "x_some_header" field.
+    return name.lower().replace('-', '_')
+
+
 class ResponseContext:
     
     __slots__ = (
@@ -93,7 +100,7 @@ class ResponseContext:
     
     def get_headers(self):
         if (
-            param_key := self.fabricator.param_keys.get('headers')
+            (param_key := self.fabricator.param_keys.get('headers')) is not None
         ):
             
             is_position = isinstance(param_key, int)
@@ -108,13 +115,54 @@ class ResponseContext:
             
         return None
     
+    def get_header(self, name: str) -> Any | None:
+        headers = self.get_headers()
+        if headers is None:
+            return None
+
+        return getattr(headers, to_header_field(name), None)
+
+    def get_cookies(self) -> Dict[str, Any]:
+        if (
+            (param_key := self.fabricator.param_keys.get('cookies')) is not None
+        ):
+            cookies: Cookies = (
+                self.args[param_key]
+                if isinstance(param_key, int)
+                else self.kwargs[param_key]
+            )
+
+            return cookies.model_dump()
+
+        cookie_header: str | None = self.get_header('cookie')
+        if cookie_header is None:
+            return {}
+
+        return Cookies.make_raw({
+            'cookie': cookie_header,
+        })
+
+    def get_cookie(self, name: str) -> Any | None:
+        if (
+            (param_key := self.fabricator.param_keys.get('cookies')) is not None
+        ):
+            cookies: Cookies = (
+                self.args[param_key]
+                if isinstance(param_key, int)
+                else self.kwargs[param_key]
+            )
+
+            return getattr(cookies, name, None)
+
+        return self.get_cookies().get(name)
+
     def get_headers_and_cookies(self):
 
         headers: Dict[str, Any] = {}
         cookies: Dict[str, Any] = {}
 
         if (
-            param_key := self.fabricator.param_keys.get('headers')
+            (param_key := self.fabricator.param_keys.get('headers')) is not None
         ):
             headers: Headers = (
                 self.args[param_key]
@@ -123,7 +171,7 @@ class ResponseContext:
             )
 
         elif (
-            param_key := self.fabricator.param_keys.get('cookies')
+            (param_key := self.fabricator.param_keys.get('cookies')) is not None
         ):
             cookies: Cookies = (
                 self.args[param_key]
@@ -159,16 +207,12 @@ class ResponseContext:
         updated_headers: Headers | None = None
 
         if headers:
-            headers_dict = headers.model_dump()
-
-            headers_dict.update(self.request_headers)
-
-            updated_headers = headers.model_copy(headers_dict)
+            updated_headers = headers.model_copy(update=self.request_headers)
 
         param_key = self.fabricator.param_keys.get('headers')
         is_position = isinstance(param_key, int)
 
-        if updated_headers and param_key and is_position:
+        if updated_headers and param_key is not None and is_position:
             self.args[param_key] = updated_headers
 
         elif updated_headers and param_key:
@@ -181,7 +225,7 @@ class ResponseContext:
         body_key = self.fabricator.param_keys.get('body')
         is_position = isinstance(body_key, int)
         
-        if body_key and is_position:
+        if body_key is not None and is_position:
             self.args[body_key] = data
 
         elif body_key:
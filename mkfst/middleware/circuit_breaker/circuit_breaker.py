@@ -4,12 +4,15 @@ import random
 from typing import (
     Any,
     Optional,
+    Set,
     Union,
 )
 
 from mkfst.env import Env, load_env
 from mkfst.env.time_parser import TimeParser
 from mkfst.logging import Logger, LogLevel
+from mkfst.logging.streams.logger_context import LoggerContext
+from mkfst.logging.streams.logger_stream import LoggerStream
 from mkfst.middleware.base import Middleware, MiddlewareType
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
@@ -18,6 +21,11 @@ from mkfst.rate_limiting.limiters import SlidingWindowLimiter
 
 from .circuit_breaker_state import CircuitBreakerState
 
+# All circuit breakers log through one Logger, which the last breaker
+# to close shuts down.
+_shared_logger = Logger()
+_shared_logger_users: Set[int] = set()
+
 
 class CircuitBreaker(Middleware):
     def __init__(
@@ -37,7 +45,11 @@ class CircuitBreaker(Middleware):
 
         env = load_env(Env)
 
-        self._logger = Logger()
+        self._logger = _shared_logger
+        _shared_logger_users.add(id(self))
+
+        self._log_context: LoggerContext | None = None
+        self._log_ctx: LoggerStream | None = None
 
         if failure_threshold is None:
             failure_threshold = env.MERCURY_SYNC_HTTP_CIRCUIT_BREAKER_FAILURE_THRESHOLD
@@ -88,11 +100,27 @@ class CircuitBreaker(Middleware):
         self._half_open_elapsed = 0
 
     def trip_breaker(self) -> bool:
+        if self._rate_per_sec_failed == 0:
+            return False
+
         failed_rate_threshold = max(self._rate_per_sec * self.failure_threshold, 1)
 
         return int(self._rate_per_sec_failed) > int(failed_rate_threshold)
 
     def reject_request(self) -> bool:
+        if (
+            self.total_completed == 0
+            and self._previous_count == 0
+            and (self._loop.time() - self._current_time) <= self.failure_window
+        ):
+            # Idle breaker - no traffic in this or the previous window,
+            # so rejection probability is zero.
+            self._rate_per_sec = 0
+            self._rate_per_sec_succeeded = 0
+            self._rate_per_sec_failed = 0
+
+            return False
+
         if (self._loop.time() - self._current_time) > self.failure_window:
             self._current_time = (
                 math.floor(self._loop.time() / self.failure_window)
@@ -135,14 +163,21 @@ class CircuitBreaker(Middleware):
 
     async def __setup__(self):
 
-        async with self._logger.context() as ctx:
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Setting up middleware - {self.__class__.__name__}',
-            ))
+        if self._log_ctx is None:
+            self._log_context = self._logger.context(
+                template="{timestamp} - {level} - {thread_id} - {message}",
+            )
+            self._log_ctx = await self._log_context.__aenter__()
+
+        ctx = self._log_ctx
 
-            self._loop = asyncio.get_event_loop()
-            self._current_time = self._loop.time()
+        await ctx.log(Event(
+            level=LogLevel.DEBUG,
+            message=f'Setting up middleware - {self.__class__.__name__}',
+        ))
+
+        self._loop = asyncio.get_event_loop()
+        self._current_time = self._loop.time()
 
     async def __run__(
         self, 
@@ -152,192 +187,205 @@ class CircuitBreaker(Middleware):
     ) -> MiddlewareResult:
         reject = self.reject_request()
 
-        async with self._logger.context(
-            template="{timestamp} - {level} - {thread_id} - {message}",
-        ) as ctx:
-            
+        ctx = self._log_ctx
+
+        await ctx.log(Event(
+            level=LogLevel.DEBUG,
+            message=f'Request - {context.method} {context.path}:{context.ip_address} - Entered circuit breaker current state - {self._breaker_state.value}',
+        ))
+
+        if (
+            self._breaker_state == CircuitBreakerState.OPEN
+            and self._closed_elapsed < self.failure_window
+        ):
+            self._closed_elapsed = self._loop.time() - self._closed_window_start
+            reject = True
+
             await ctx.log(Event(
                 level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Entered circuit breaker current state - {self._breaker_state.value}',
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Not enough time has elapsed since failure state - rejecting request',
             ))
-            
-            if (
-                self._breaker_state == CircuitBreakerState.OPEN
-                and self._closed_elapsed < self.failure_window
-            ):
-                self._closed_elapsed = self._loop.time() - self._closed_window_start
-                reject = True
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Not enough time has elapsed since failure state - rejecting request',
-                ))
+        elif self._breaker_state == CircuitBreakerState.OPEN:
+            self._breaker_state = CircuitBreakerState.HALF_OPEN
 
-            elif self._breaker_state == CircuitBreakerState.OPEN:
-                self._breaker_state = CircuitBreakerState.HALF_OPEN
+            self._half_open_window_start = self._loop.time()
+            self._closed_elapsed = 0
 
-                self._half_open_window_start = self._loop.time()
-                self._closed_elapsed = 0
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Setting breaker state from {CircuitBreakerState.OPEN.value} to {self._breaker_state.value}',
+            ))
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Setting breaker state from {CircuitBreakerState.OPEN.value} to {self._breaker_state.value}',
-                ))
+        if (
+            self._breaker_state == CircuitBreakerState.HALF_OPEN
+            and self._half_open_elapsed < self.failure_window
+        ):
+            self._half_open_elapsed = self._loop.time() - self._half_open_window_start
 
-            if (
-                self._breaker_state == CircuitBreakerState.HALF_OPEN
-                and self._half_open_elapsed < self.failure_window
-            ):
-                self._half_open_elapsed = self._loop.time() - self._half_open_window_start
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - {self._half_open_elapsed} seconds elapsed since entered {self._breaker_state.value} state',
+            ))
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - {self._half_open_elapsed} seconds elapsed since entered {self._breaker_state.value} state',
-                ))
+        elif self._breaker_state == CircuitBreakerState.HALF_OPEN:
+            self._breaker_state = CircuitBreakerState.CLOSED
+            self._half_open_elapsed = 0
 
-            elif self._breaker_state == CircuitBreakerState.HALF_OPEN:
-                self._breaker_state = CircuitBreakerState.CLOSED
-                self._half_open_elapsed = 0
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Setting breaker state from {CircuitBreakerState.HALF_OPEN.value} to {self._breaker_state.value}',
+            ))
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Setting breaker state from {CircuitBreakerState.HALF_OPEN.value} to {self._breaker_state.value}',
-                ))
+            await ctx.log(Event(
+                level=LogLevel.WARN,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Request tripped circuit breaker',
+            ))
 
-                await ctx.log(Event(
-                    level=LogLevel.WARN,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Request tripped circuit breaker',
-                ))
+        if reject:
+            context.response_headers["x-mercury-sync-overload"] = True
+            context.status = 503
 
-            if reject:
-                context.response_headers["x-mercury-sync-overload"] = True
-                context.status = 503
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejecting request with status of {context.status}',
+            ))
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejecting request with status of {context.status}',
-                ))
+        else:
+            try:
 
-            else:
-                try:
-
-                    if self.wraps:
-
-                        await ctx.log(Event(
-                            level=LogLevel.DEBUG,
-                            message=f'Request - {context.method} {context.path}:{context.ip_address} - Executing wrapped middleware {handler.__class__.__name__}',
-                        ))
-
-                        (context, response) = await asyncio.wait_for(
-                            handler(
-                                context=context,
-                                response=response
-                            ), 
-                            timeout=self.handler_timeout
-                        )
-
-                        await ctx.log(Event(
-                            level=LogLevel.DEBUG,
-                            message=f'Request - {context.method} {context.path}:{context.ip_address} - {handler.__class__.__name__} completed middleware',
-                        ))
-
-                    else:
-
-                        await ctx.log(Event(
-                            level=LogLevel.DEBUG,
-                            message=f'Request - {context.method} {context.path}:{context.ip_address} - Executing wrapped request handler',
-                        ))
-
-                        response = await asyncio.wait_for(
-                            handler(
-                                *context.args, 
-                                **context.kwargs
-                            ), 
-                            timeout=self.handler_timeout
-                        )
-
-                        await ctx.log(Event(
-                            level=LogLevel.DEBUG,
-                            message=f'Request - {context.method} {context.path}:{context.ip_address} - Request handler completed execution',
-                        ))
-                    
-                    context.response_headers["x-mercury-sync-overload"] = False
-
-                except (
-                    asyncio.TimeoutError,
-                    asyncio.CancelledError,
-                ):
-                    context.response_headers["x-mercury-sync-overload"] = True
-                    context.status = 503
+                if self.wraps:
 
                     await ctx.log(Event(
                         level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Request timed out with status of {context.status}',
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Executing wrapped middleware {handler.__class__.__name__}',
                     ))
 
-                # Don't count rejections toward failure stats.
-                if context.status and context.status >= 400:
-                    self.failed += 1
+                    (context, response) = await asyncio.wait_for(
+                        handler(
+                            context=context,
+                            response=response
+                        ), 
+                        timeout=self.handler_timeout
+                    )
 
                     await ctx.log(Event(
                         level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated failed count {self.failed}',
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - {handler.__class__.__name__} completed middleware',
                     ))
 
-                elif context.status is None or (
-                    context.status and context.status < 400
-                ):
-                    self.succeeded += 1
+                else:
 
                     await ctx.log(Event(
                         level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated successful count {self.succeeded}',
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Executing wrapped request handler',
                     ))
 
-                self.total_completed += 1
+                    response = await asyncio.wait_for(
+                        handler(
+                            *context.args, 
+                            **context.kwargs
+                        ), 
+                        timeout=self.handler_timeout
+                    )
+
+                    await ctx.log(Event(
+                        level=LogLevel.DEBUG,
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Request handler completed execution',
+                    ))
+
+                context.response_headers["x-mercury-sync-overload"] = False
+
+            except (
+                asyncio.TimeoutError,
+                asyncio.CancelledError,
+            ):
+                context.response_headers["x-mercury-sync-overload"] = True
+                context.status = 503
+
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Request timed out with status of {context.status}',
+                ))
+
+            # Don't count rejections toward failure stats.
+            if context.status and context.status >= 400:
+                self.failed += 1
 
                 await ctx.log(Event(
                     level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated completed count {self.total_completed}',
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated failed count {self.failed}',
                 ))
 
-            breaker_open = (
-                self._breaker_state == CircuitBreakerState.CLOSED
-                or self._breaker_state == CircuitBreakerState.HALF_OPEN
-            )
+            elif context.status is None or (
+                context.status and context.status < 400
+            ):
+                self.succeeded += 1
+
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated successful count {self.succeeded}',
+                ))
+
+            self.total_completed += 1
 
             await ctx.log(Event(
                 level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Breaker state open is - {breaker_open}',
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Updated completed count {self.total_completed}',
             ))
 
-            if self.trip_breaker() and breaker_open:
-                self._breaker_state = CircuitBreakerState.OPEN
-                reject = True
+        breaker_open = (
+            self._breaker_state == CircuitBreakerState.CLOSED
+            or self._breaker_state == CircuitBreakerState.HALF_OPEN
+        )
 
-                self._closed_window_start = self._loop.time()
-                self._half_open_elapsed = 0
+        await ctx.log(Event(
+            level=LogLevel.DEBUG,
+            message=f'Request - {context.method} {context.path}:{context.ip_address} - Breaker state open is - {breaker_open}',
+        ))
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Resetting circuit breaker',
-                ))
+        if self.trip_breaker() and breaker_open:
+            self._breaker_state = CircuitBreakerState.OPEN
+            reject = True
 
-            if reject:
-                await ctx.log(Event(
-                    level=LogLevel.WARN,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Circuit breaker rejected request',
-                ))
+            self._closed_window_start = self._loop.time()
+            self._half_open_elapsed = 0
 
-                context.errors.append(Exception('Err. - request temporarily rejected.')) 
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Resetting circuit breaker',
+            ))
+
+        if reject:
+            await ctx.log(Event(
+                level=LogLevel.WARN,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Circuit breaker rejected request',
+            ))
+
+            context.errors.append(Exception('Err. - request temporarily rejected.')) 
 
-            return (
-                context,
-                response,
-            ), reject is False
+        return (
+            context,
+            response,
+        ), reject is False
 
     async def close(self):
-        await self._logger.close()
+        if self._log_context is not None:
+            await self._log_context.__aexit__(None, None, None)
+
+        self._log_context = None
+        self._log_ctx = None
+
+        _shared_logger_users.discard(id(self))
+
+        if len(_shared_logger_users) < 1:
+            await self._logger.close()
 
     def abort(self):
-        self._logger.abort()
\ No newline at end of file
+        self._log_context = None
+        self._log_ctx = None
+
+        _shared_logger_users.discard(id(self))
+
+        if len(_shared_logger_users) < 1:
+            self._logger.abort()
\ No newline at end of file
@@ -0,0 +1,346 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Union,
+)
+
+from mkfst.logging import Logger, LogLevel
+from mkfst.logging.streams.logger_stream import LoggerStream
+from mkfst.middleware.base import Middleware, MiddlewareType
+from mkfst.middleware.base.response_context import ResponseContext
+from mkfst.middleware.base.types import MiddlewareResult
+from mkfst.models.http.file_upload import FileUpload
+from mkfst.models.http.parse_response import parse_response_bytes
+from mkfst.models.logging import Event
+
+from .encode_utf8 import encode_utf8
+
+# All compressors log through one Logger. Each instance registers
+# itself here and the last one to close shuts the logger down.
+_shared_logger = Logger()
+_shared_logger_users: Set[int] = set()
+
+
+class BaseCompressor(Middleware):
+    def __init__(
+        self,
+        name: str,
+        codec: str,
+        compressor: str,
+        encoding: str,
+        middleware_type: MiddlewareType = MiddlewareType.UNIDIRECTIONAL_AFTER,
+        compression_level: int = 9,
+        serializers: Dict[
+            str, Callable[..., Union[str, None]]
+        ] = {},
+        min_size: int = 256,
+        offload_size: int = 2048,
+        response_headers: Dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(
+            name,
+            middleware_type=middleware_type,
+            response_headers=response_headers,
+        )
+
+        self.compression_level = compression_level
+        self.min_size = min_size
+        self.offload_size = offload_size
+        self.encoding = encoding
+        self.serializers = serializers
+
+        self._codec = codec
+        self._compressor = compressor
+        self._encoding_headers = {
+            "x-compression-encoding": encoding
+        }
+
+        self._response_compressors: Dict[
+            type,
+            Callable[
+                [ResponseContext, Any, List[Event]],
+                Awaitable[MiddlewareResult],
+            ],
+        ] = {
+            type(None): self._skip_empty_response,
+            str: self._compress_str_response,
+        }
+
+        self._logger = _shared_logger
+        _shared_logger_users.add(id(self))
+
+        self._log_ctx: LoggerStream | None = None
+
+    def _compress_data(self, data: bytes) -> bytes:
+        raise NotImplementedError(
+            "Err. - _compress_data() is not implemented for BaseCompressor class."
+        )
+
+    async def _compress(self, data: bytes) -> bytes:
+        if len(data) > self.offload_size:
+            # Compression releases the GIL, so run larger payloads
+            # in a thread to avoid blocking the event loop.
+            return await asyncio.to_thread(
+                self._compress_data,
+                data,
+            )
+
+        return self._compress_data(data)
+
+    async def __setup__(self):
+        if self._log_ctx is None:
+            self._log_ctx = await self._logger.context(
+                template="{timestamp} - {level} - {thread_id} - {message}",
+            ).__aenter__()
+
+    async def _compress_request(
+        self,
+        context: ResponseContext,
+        response: Any | None = None,
+    ) -> MiddlewareResult:
+        debug = self._logger.enabled(LogLevel.DEBUG)
+        events: List[Event] = []
+
+        if debug:
+            events.append(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing request via {self._codec} with level {self.compression_level} compression'
+            ))
+
+        data = context.get_bytes_arg()
+        try:
+            if data and len(data) < self.min_size:
+                if debug:
+                    events.append(Event(
+                        level=LogLevel.DEBUG,
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Request below minimum compression size of {self.min_size} bytes - skipping compression'
+                    ))
+
+            elif data:
+                compressed_data = await self._compress(data)
+
+                context.update_request_data(compressed_data)
+                context.update_request_headers({
+                    **self._encoding_headers,
+                    # Lets the receiving decompressor size its output
+                    # buffer up front.
+                    "x-original-length": str(len(data)),
+                })
+
+                if debug:
+                    events.append(Event(
+                        level=LogLevel.DEBUG,
+                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed request via {self._codec} with level {self.compression_level} compression'
+                    ))
+
+            else:
+                events.append(Event(
+                    level=LogLevel.WARN,
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - No request to compress'
+                ))
+
+            result = (
+                context,
+                response
+            ), True
+
+        except Exception as e:
+            result = self._compression_failed(
+                context,
+                response,
+                e,
+                events,
+            )
+
+        if events:
+            await self._log_ctx.log_batch(events)
+
+        return result
+
+    async def _compress_response(
+        self,
+        context: ResponseContext,
+        response: Any | None = None,
+    ) -> MiddlewareResult:
+        compress_response = self._response_compressors.get(
+            type(response),
+            self._compress_serialized_response,
+        )
+
+        events: List[Event] = []
+
+        try:
+            result = await compress_response(
+                context,
+                response,
+                events,
+            )
+
+        except Exception as e:
+            result = self._compression_failed(
+                context,
+                response,
+                e,
+                events,
+            )
+
+        if events:
+            await self._log_ctx.log_batch(events)
+
+        return result
+
+    async def _skip_empty_response(
+        self,
+        context: ResponseContext,
+        response: None,
+        events: List[Event],
+    ) -> MiddlewareResult:
+        events.append(Event(
+            level=LogLevel.WARN,
+            message=f'Request - {context.method} {context.path}:{context.ip_address} - No response to compress'
+        ))
+
+        return (
+            context,
+            response
+        ), True
+
+    async def _compress_str_response(
+        self,
+        context: ResponseContext,
+        response: str,
+        events: List[Event],
+    ) -> MiddlewareResult:
+        debug = self._logger.enabled(LogLevel.DEBUG)
+
+        if len(response) < self.min_size:
+            context.response_headers["x-compression-encoding"] = "identity"
+
+            if debug:
+                events.append(Event(
+                    level=LogLevel.DEBUG,
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Response below minimum compression size of {self.min_size} bytes - skipping compression'
+                ))
+
+            return (
+                context,
+                response
+            ), True
+
+        if debug:
+            events.append(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing string response via {self._codec} with level {self.compression_level} compression'
+            ))
+
+        compressed_data = await self._compress(encode_utf8(response))
+
+        context.response_headers["x-compression-encoding"] = self.encoding
+
+        if debug:
+            events.append(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed response via {self._codec} with level {self.compression_level} compression'
+            ))
+
+        return (
+            context,
+            compressed_data
+        ), True
+
+    async def _compress_serialized_response(
+        self,
+        context: ResponseContext,
+        response: Any,
+        events: List[Event],
+    ) -> MiddlewareResult:
+        debug = self._logger.enabled(LogLevel.DEBUG)
+
+        if debug:
+            events.append(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing response via {self._codec} with level {self.compression_level} compression'
+            ))
+
+        if isinstance(response, FileUpload) and response.path is not None:
+            # Compressing needs the whole file in memory, and reading it
+            # blocks, so serialize path-backed uploads on a worker thread.
+            serialized = await asyncio.to_thread(
+                parse_response_bytes,
+                response,
+                context.parser,
+            )
+
+        else:
+            serialized = parse_response_bytes(
+                response,
+                context.parser
+            )
+
+        if len(serialized) < self.min_size:
+            context.response_headers["x-compression-encoding"] = "identity"
+
+            if debug:
+                events.append(Event(
+                    level=LogLevel.DEBUG,
+                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Response below minimum compression size of {self.min_size} bytes - skipping compression'
+                ))
+
+            return (
+                context,
+                serialized
+            ), True
+
+        compressed_data = await self._compress(serialized)
+
+        context.response_headers["x-compression-encoding"] = self.encoding
+
+        if debug:
+            events.append(Event(
+                level=LogLevel.DEBUG,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed response via {self._codec} with level {self.compression_level} compression'
+            ))
+
+        return (
+            context,
+            compressed_data
+        ), True
+
+    def _compression_failed(
+        self,
+        context: ResponseContext,
+        response: Any | None,
+        error: Exception,
+        events: List[Event],
+    ) -> MiddlewareResult:
+        context.compressor = self._compressor
+        context.compression_level = self.compression_level
+        context.errors.append(error)
+        context.status = 500
+
+        events.append(Event(
+            level=LogLevel.ERROR,
+            message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error {self._codec} compressing request - {str(error)}'
+        ))
+
+        return (
+            context,
+            response,
+        ), False
+
+    async def close(self):
+        _shared_logger_users.discard(id(self))
+
+        if len(_shared_logger_users) < 1:
+            await self._logger.close()
+
+    def abort(self):
+        _shared_logger_users.discard(id(self))
+
+        if len(_shared_logger_users) < 1:
+            self._logger.abort()
@@ -0,0 +1,97 @@
+import threading
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Union,
+)
+
+import zstandard
+
+from mkfst.middleware.base import MiddlewareType
+
+from .base_compressor import BaseCompressor
+
+
+class BaseZStandardCompressor(BaseCompressor):
+    def __init__(
+        self,
+        name: str,
+        middleware_type: MiddlewareType = MiddlewareType.UNIDIRECTIONAL_AFTER,
+        compression_level: int = 9,
+        serializers: Dict[
+            str, Callable[..., Union[str, None]]
+        ] = {},
+        min_size: int = 256,
+        offload_size: int = 2048,
+        dict_samples: List[bytes] | None = None,
+        dict_size: int = 16384,
+        parallel_size: int = 128 * 1024,
+        response_headers: Dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(
+            name,
+            'ZStd',
+            'zstd',
+            'zstd',
+            middleware_type=middleware_type,
+            compression_level=compression_level,
+            serializers=serializers,
+            min_size=min_size,
+            offload_size=offload_size,
+            response_headers=response_headers,
+        )
+
+        self.parallel_size = parallel_size
+        self._compressors = threading.local()
+
+        self.dictionary: zstandard.ZstdCompressionDict | None = None
+        if dict_samples:
+            self.dictionary = zstandard.train_dictionary(
+                dict_size,
+                dict_samples,
+            )
+
+    def _get_compressor(
+        self,
+        name: str = 'compressor',
+        threads: int = 0,
+    ) -> zstandard.ZstdCompressor:
+        # ZstdCompressor instances are not thread safe, so keep one
+        # (and its reusable compression context) per thread.
+        compressor: zstandard.ZstdCompressor | None = getattr(
+            self._compressors,
+            name,
+            None,
+        )
+
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(
+                level=self.compression_level,
+                dict_data=self.dictionary,
+                threads=threads,
+            )
+
+            setattr(self._compressors, name, compressor)
+
+        return compressor
+
+    def load_dictionary(self, path: str):
+        with open(path, 'rb') as dictionary_file:
+            self.dictionary = zstandard.ZstdCompressionDict(
+                dictionary_file.read()
+            )
+
+        # Discard compressors built without the dictionary.
+        self._compressors = threading.local()
+
+    def _compress_data(self, data: bytes) -> bytes:
+        if len(data) >= self.parallel_size:
+            # Large payloads are worth handing to zstd's worker
+            # threads; for small ones the thread overhead dominates.
+            return self._get_compressor(
+                name='parallel_compressor',
+                threads=-1,
+            ).compress(data)
+
+        return self._get_compressor().compress(data)
@@ -1,39 +1,61 @@
-from base64 import b64encode
-from gzip import compress
 from typing import (
     Any,
     Callable,
     Dict,
+    Literal,
     Union,
 )
 
-from mkfst.logging import Logger, LogLevel
-from mkfst.middleware.base import Middleware, MiddlewareType
+try:
+    from deflate import gzip_compress as compress
+    from deflate import zlib_compress
+
+except ImportError:
+    from gzip import compress
+    from zlib import compress as zlib_compress
+
+from mkfst.middleware.base import MiddlewareType
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
-from mkfst.models.http.parse_response import parse_response
-from mkfst.models.logging import Event
 
+from .base_compressor import BaseCompressor
 
-class BidirectionalGZipCompressor(Middleware):
+
+class BidirectionalGZipCompressor(BaseCompressor):
     def __init__(
         self,
         compression_level: int = 9,
         serializers: Dict[
             str, Callable[..., Union[str, None]]
         ] = {},
+        min_size: int = 256,
+        offload_size: int = 2048,
+        encoding: Literal['gzip', 'deflate'] = 'gzip',
     ) -> None:
         super().__init__(
-            self.__class__.__name__, 
+            self.__class__.__name__,
+            'GZip',
+            'gzip',
+            encoding,
             middleware_type=MiddlewareType.BIDIRECTIONAL,
+            compression_level=compression_level,
+            serializers=serializers,
+            min_size=min_size,
+            offload_size=offload_size,
             response_headers={
-                "x-compression-encoding": "gzip"
-            }
+                "x-compression-encoding": encoding
+            },
+        )
+
+        self._compress_fn = (
+            zlib_compress if encoding == 'deflate' else compress
         )
 
-        self.compression_level = compression_level
-        self.serializers = serializers
-        self._logger = Logger()
+    def _compress_data(self, data: bytes) -> bytes:
+        return self._compress_fn(
+            data,
+            self.compression_level,
+        )
 
     async def __pre__(
         self,
@@ -41,151 +63,18 @@ class BidirectionalGZipCompressor(Middleware):
         response: Any | None = None,
         handler: MiddlewareHandler | Handler | None = None,
     ) -> MiddlewareResult:
-        
-        async with self._logger.context(
-            template="{timestamp} - {level} - {thread_id} - {message}",
-        ) as ctx:
-            
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing request via GZip with level {self.compression_level} compression'
-            ))
-            
-            data = context.get_bytes_arg()
-            compressed_data = b''
-            try:
-                if data != b"":
-                    compressed_data = compress(
-                        data, 
-                        compresslevel=self.compression_level,
-                    )
-
-                    context.update_request_data(compressed_data)
-                    context.update_request_headers({
-                        "x-compression-encoding": "gzip"
-                    })
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed request via GZip with level {self.compression_level} compression'
-                    ))
-
-                else:
-                    await ctx.log(Event(
-                        level=LogLevel.WARN,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No request to compress'
-                    ))
-
-                return (
-                    context,
-                    response
-                ), True
-
-            except Exception as e:
-                context.compressor = 'gzip'
-                context.compression_level = self.compression_level
-                context.errors.append(e)
-                context.status = 500
-
-                await ctx.log(Event(
-                    level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error GZip compressing request - {str(e)}'
-                ))
-
-                return (
-                    context,
-                    response
-                ), False
+        return await self._compress_request(
+            context,
+            response,
+        )
 
     async def __post__(
         self,
         context: ResponseContext | None = None,
         response: Any | None = None,
         handler: MiddlewareHandler | Handler | None = None,
-    ):
-        async with self._logger.context(
-            template="{timestamp} - {level} - {thread_id} - {message}",
-        ) as ctx:
-            try:
-                if response is None:
-                    await ctx.log(Event(
-                        level=LogLevel.WARN,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No response to compress'
-                    ))
-
-                    return (
-                        context,
-                        response
-                    ), True
-
-                elif isinstance(response, str):
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing string response via GZip with level {self.compression_level} compression'
-                    ))
-                    
-                    compressed_data = compress(
-                        response.encode(), 
-                        compresslevel=self.compression_level,
-                    )
-
-                    context.response_headers["x-compression-encoding"] = "gzip"
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed response via GZip with level {self.compression_level} compression'
-                    ))
-                    
-                    return (
-                        context,
-                        b64encode(compressed_data).decode()
-                    ), True
-
-                else:
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressing response via GZip with level {self.compression_level} compression'
-                    ))
-
-                    serialized = parse_response(
-                        response,
-                        context.parser
-                    )
-
-                    compressed_data = compress(
-                        serialized, compresslevel=self.compression_level
-                    )
-
-                    context.response_headers["x-compression-encoding"] = "gzip"
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Compressed response via GZip with level {self.compression_level} compression'
-                    ))
-
-                    return (
-                        context,
-                        b64encode(compressed_data).decode()
-                    ), True
-
-            except Exception as e:
-                context.compressor = 'gzip'
-                context.compression_level = self.compression_level
-                context.errors.append(e)
-                context.status = 500
-
-                await ctx.log(Event(
-                    level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error GZip compressing request - {str(e)}'
-                ))
-
-                return (
-                    context,
-                    response,
-                ), False
-
-    async def close(self):
-        await self._logger.close()
-
-    def abort(self):
-        self._logger.abort()
\ No newline at end of file
+    ) -> MiddlewareResult:
+        return await self._compress_response(
+            context,
+            response,
+        )
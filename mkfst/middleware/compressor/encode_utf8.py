@@ -0,0 +1,15 @@
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_cached(value: str) -> bytes:
+    return value.encode()
+
+
+def encode_utf8(value: str) -> bytes:
+    # Only cache short strings (i.e. static error or template
+    # responses) so large one-off bodies don't churn the cache.
+    if len(value) > 4096:
+        return value.encode()
+
+    return _encode_cached(value)
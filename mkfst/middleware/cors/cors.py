@@ -1,15 +1,20 @@
+from functools import lru_cache
 from typing import (
     Any,
+    Dict,
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
 )
 
 from mkfst.logging import Logger, LogLevel
+from mkfst.logging.streams.logger_stream import LoggerStream
 from mkfst.middleware.base import Middleware
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
+from mkfst.models.http.request_models import Headers
 from mkfst.models.logging import Event
 
 from .cors_headers import CorsHeaders
@@ -49,12 +54,28 @@ class Cors(Middleware):
         if allowed_headers:
             self.allow_all_headers = "*" in allowed_headers
 
+        self._allowed_headers = frozenset(
+            header.lower() for header in (allowed_headers or [])
+        )
+
         self.simple_headers = self._cors_config.to_simple_headers()
         self.preflight_headers = self._cors_config.to_preflight_headers()
         self.preflight_explicit_allow_origin = (
             not self.allow_all_origins or self.allow_credentials
         )
 
+        # Policy decisions depend only on a handful of request header
+        # values, so memoize them per instance rather than re-validating
+        # the same origin/method/header combinations on every request.
+        # The cached header dicts are shared between requests, so they
+        # are only ever merged into the response headers, never mutated.
+        self._evaluate_preflight = lru_cache(maxsize=4096)(
+            self._evaluate_preflight_policy
+        )
+        self._evaluate_simple = lru_cache(maxsize=4096)(
+            self._evaluate_simple_policy
+        )
+
         self._logger = Logger()
 
         super().__init__(
@@ -72,138 +93,227 @@ class Cors(Middleware):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
+            
+            if debug:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + 'Verifying request meets CORS policy'
+                ))
             
+            headers = context.get_headers()
+
+            # Header models store names with dashes replaced by
+            # underscores, so read the few fields we need directly
+            # rather than dumping the whole model.
+            origin: str | None = getattr(headers, "origin", None)
+
+            access_control_request_method: str | None = None
+            if context.method == "OPTIONS":
+                access_control_request_method = getattr(headers, "access_control_request_method", None)
+
+            if access_control_request_method:
+                return await self._handle_preflight(
+                    context,
+                    response,
+                    ctx,
+                    headers,
+                    origin,
+                    access_control_request_method,
+                    debug,
+                    log_prefix,
+                )
+
+            return await self._handle_simple(
+                context,
+                response,
+                ctx,
+                headers,
+                origin,
+                debug,
+                log_prefix,
+            )
+
+    async def _handle_preflight(
+        self,
+        context: ResponseContext,
+        response: Any | None,
+        ctx: LoggerStream,
+        headers: Headers | None,
+        origin: str | None,
+        access_control_request_method: str,
+        debug: bool,
+        log_prefix: str,
+    ) -> MiddlewareResult:
+        access_control_request_headers: str | None = getattr(headers, "access_control_request_headers", "")
+
+        if debug:
             await ctx.log(Event(
                 level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Verifying request meets CORS policy'
+                message=log_prefix + 'Verifying OPTIONS request meets CORS policy'
             ))
-            
-            headers = context.get_headers()
-            method = context.method
 
-            if headers:            
-                parsed_headers = headers.model_dump()
+        (
+            response_headers,
+            failures,
+        ) = self._evaluate_preflight(
+            origin,
+            access_control_request_method,
+            access_control_request_headers,
+        )
 
-            else:
-                parsed_headers = {}
+        if debug and "origin" in failures:
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'{log_prefix}Origin of {origin} failed Allowed Origin policy'
+            ))
 
-            origin = parsed_headers.get("origin")
-            access_control_request_method: str | None = parsed_headers.get("access-control-request-method")
-            access_control_request_headers: str | None = parsed_headers.get("access-control-request-headers", "")
+        if debug and "method" in failures:
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'{log_prefix}Method of {access_control_request_method} failed Allowed Methods policy'
+            ))
 
-            if method == "OPTIONS" and access_control_request_method:
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Verifying OPTIONS request meets CORS policy'
-                ))
+        if debug and "headers" in failures:
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=f'{log_prefix}Headers of {access_control_request_headers} failed Allowed Headers policy'
+            ))
 
-                response_headers = dict(self.preflight_headers)
-
-                failures: List[str] = []
-
-                if self.allow_all_origins is False and origin not in self.origins:
-                    failures.append("origin")
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Origin of {origin} failed Allowed Origin policy'
-                    ))
-
-                elif self.preflight_explicit_allow_origin:
-                    response["Access-Control-Allow-Origin"] = origin
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Adding preflight origin of {origin}'
-                    ))
-
-                if access_control_request_method not in self.cors_methods:
-                    failures.append("method")
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Method of {method} failed Allowed Methods policy'
-                    ))
-
-                if self.allow_all_headers and access_control_request_headers is not None:
-                    response_headers["Access-Control-Allow-Headers"] = (
-                        access_control_request_headers
-                    )
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Adding CORS headers to response'
-                    ))
-
-                elif access_control_request_headers:
-                    for header in access_control_request_headers.split(","):
-                        if header.lower().strip() not in self.cors_headers:
-                            failures.append("headers")
-                            await ctx.log(Event(
-                                level=LogLevel.DEBUG,
-                                message=f'Request - {context.method} {context.path}:{context.ip_address} - Header of {header} failed Allowed Headers policy'
-                            ))
-
-                            break
-
-                if len(failures) > 0:
-                    failures_message = ", ".join(failures)
-                    context.status = 401
-
-                    context.errors.append(
-                        Exception(failures_message)
-                    )
-
-                    await ctx.log(Event(
-                        level=LogLevel.ERROR,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejected by CORS policy with status of {context.status}'
-                    ))
-
-                    return (
-                        context,
-                        f"Disallowed CORS {failures_message}",
-                    ), False
-
-
-                context.response_headers.update(response_headers)
-
-                context.errors.append(
-                    Exception('Rejected by CORS policy')
-                )
+        if len(failures) > 0:
+            failures_message = ", ".join(failures)
+            context.status = 401
 
-                await ctx.log(Event(
-                    level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejected by CORS policy with status of {context.status}'
-                ))
+            context.errors.append(
+                Exception(failures_message)
+            )
 
-                return (
-                    context,
-                    response,
-                ), False
+            await ctx.log(Event(
+                level=LogLevel.ERROR,
+                message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejected by CORS policy with status of {context.status}'
+            ))
 
-            response_headers = dict(self.simple_headers)
+            return (
+                context,
+                f"Disallowed CORS {failures_message}",
+            ), False
 
-            if self.allow_all_origins and parsed_headers.get("cookie"):
-                response_headers["access-control-allow-origin"] = origin
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Adding allowed origin of {origin}'
-                ))
+        context.response_headers.update(response_headers)
 
-            elif origin in self.origins:
-                response_headers["access-control-allow-origin"] = origin
+        context.errors.append(
+            Exception('Rejected by CORS policy')
+        )
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Adding allowed origin of {origin}'
-                ))
+        await ctx.log(Event(
+            level=LogLevel.ERROR,
+            message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejected by CORS policy with status of {context.status}'
+        ))
 
-            context.response_headers.update(response_headers)
+        return (
+            context,
+            response,
+        ), False
 
+    async def _handle_simple(
+        self,
+        context: ResponseContext,
+        response: Any | None,
+        ctx: LoggerStream,
+        headers: Headers | None,
+        origin: str | None,
+        debug: bool,
+        log_prefix: str,
+    ) -> MiddlewareResult:
+        (
+            response_headers,
+            origin_allowed,
+        ) = self._evaluate_simple(
+            origin,
+            bool(getattr(headers, "cookie", None)),
+        )
+
+        if debug and origin_allowed:
             await ctx.log(Event(
                 level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Request met CORS policy'
+                message=f'{log_prefix}Adding allowed origin of {origin}'
             ))
 
-            return (
-                context,
-                response,
-            ), True
+        context.response_headers.update(response_headers)
+
+        if debug:
+            await ctx.log(Event(
+                level=LogLevel.DEBUG,
+                message=log_prefix + 'Request met CORS policy'
+            ))
+
+        return (
+            context,
+            response,
+        ), True
+
+    def _evaluate_preflight_policy(
+        self,
+        origin: str | None,
+        access_control_request_method: str,
+        access_control_request_headers: str | None,
+    ) -> Tuple[
+        Dict[str, str],
+        Tuple[str, ...],
+    ]:
+        response_headers = dict(self.preflight_headers)
+        failures: List[str] = []
+
+        if self.allow_all_origins is False and origin not in self.origins:
+            failures.append("origin")
+
+        elif self.preflight_explicit_allow_origin:
+            response_headers["Access-Control-Allow-Origin"] = origin
+
+        if access_control_request_method not in self.cors_methods:
+            failures.append("method")
+
+        if self.allow_all_headers and access_control_request_headers is not None:
+            response_headers["Access-Control-Allow-Headers"] = (
+                access_control_request_headers
+            )
+
+        elif access_control_request_headers:
+            requested_headers = frozenset(
+                header.strip()
+                for header in access_control_request_headers.lower().split(",")
+            ) - {""}
+
+            if not requested_headers.issubset(self._allowed_headers):
+                failures.append("headers")
+
+        return (
+            response_headers,
+            tuple(failures),
+        )
+
+    def _evaluate_simple_policy(
+        self,
+        origin: str | None,
+        has_cookie: bool,
+    ) -> Tuple[
+        Dict[str, str],
+        bool,
+    ]:
+        response_headers = dict(self.simple_headers)
+        origin_allowed = (
+            self.allow_all_origins and has_cookie
+        ) or origin in self.origins
+
+        if origin_allowed:
+            response_headers["access-control-allow-origin"] = origin
+
+        return (
+            response_headers,
+            origin_allowed,
+        )
@@ -1,5 +1,5 @@
-from base64 import b64decode, b64encode
-from http.cookies import BaseCookie, SimpleCookie
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from secrets import compare_digest, token_urlsafe
 from typing import (
     Any,
@@ -10,7 +10,7 @@ from typing import (
     Set,
 )
 
-import zstandard
+from cryptography.exceptions import InvalidTag
 
 from mkfst.encryption import AESGCMFernet
 from mkfst.env import Env, load_env
@@ -20,6 +20,9 @@ from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
 from mkfst.models.logging import Event
 
+# 32 byte key + 12 byte nonce + 16 byte GCM tag.
+_MIN_TOKEN_SIZE = 60
+
 
 class CRSF(Middleware):
     def __init__(
@@ -56,8 +59,29 @@ class CRSF(Middleware):
         self.cookie_samesite = cookie_samesite
         self.header_name = header_name
 
-        self._compressor = zstandard.ZstdCompressor()
-        self._decompressor = zstandard.ZstdDecompressor()
+        self._required_paths = tuple(required_paths or ())
+        self._exempt_paths = tuple(exempt_paths or ())
+        self._sensitive_cookies = frozenset(sensitive_cookies or ())
+        self._safe_methods = frozenset(safe_methods)
+
+        # Cookie attributes never change between requests, so render them
+        # once (in the same order SimpleCookie would) rather than building
+        # and serializing a SimpleCookie for every token we issue.
+        cookie_attributes: List[str] = []
+        if cookie_domain is not None:
+            cookie_attributes.append(f"Domain={cookie_domain}")
+
+        if cookie_httponly:
+            cookie_attributes.append("HttpOnly")
+
+        cookie_attributes.append(f"Path={cookie_path}")
+        cookie_attributes.append(f"SameSite={cookie_samesite}")
+
+        if cookie_secure:
+            cookie_attributes.append("Secure")
+
+        self._cookie_attributes = "; ".join(cookie_attributes)
+
         self._logger = Logger()
 
         super().__init__(self.__class__.__name__, response_headers={})
@@ -71,68 +95,46 @@ class CRSF(Middleware):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Verifying CRSF token'
-            ))
+            if debug:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + 'Verifying CRSF token'
+                ))
             
-            (headers, cookies) = context.get_headers_and_cookies()
             request_path = context.path
-            request_method = context.method
-
-            crsf_cookie = cookies.get(self.cookie_name)
-
-            is_unsafe_method = request_method not in self.safe_methods
+            is_unsafe_method = context.method not in self._safe_methods
 
             path_is_required = False
             if self.required_paths:
                 path_is_required = self._path_is_required(request_path)
 
-            path_is_exempt = False
-            if self.exempt_paths:
-                path_is_exempt = self._path_is_exempt(request_path)
-
-            has_sensitive_cookies = False
-            if self.sensitive_cookies:
-                has_sensitive_cookies = self._has_sensitive_cookies(cookies)
-
-            is_sensitive = is_unsafe_method and not path_is_exempt and has_sensitive_cookies
+            # Only unsafe requests that carry sensitive cookies need the
+            # full cookie jar - everything else just needs to know if a
+            # token cookie has already been issued.
+            is_sensitive = False
+            if (
+                is_unsafe_method
+                and self.sensitive_cookies
+                and not (self.exempt_paths and self._path_is_exempt(request_path))
+            ):
+                cookies = context.get_cookies()
+                is_sensitive = self._has_sensitive_cookies(cookies)
+                crsf_cookie = cookies.get(self.cookie_name)
+
+            else:
+                crsf_cookie = context.get_cookie(self.cookie_name)
 
             if path_is_required or is_sensitive:
-                submitted_csrf_token: str | None = headers.get(self.header_name)
-
-                csrf_tokens_match = False
+                submitted_csrf_token: str | None = context.get_header(self.header_name)
 
-                try:
-                    decoded_crsf_cookie: str = self.encryptor.decrypt(
-                        self._decompressor.decompress(b64decode(crsf_cookie.encode()))
-                    )
-                    decoded_crsf_token: str = self.encryptor.decrypt(
-                        self._decompressor.decompress(
-                            b64decode(submitted_csrf_token.encode())
-                        )
-                    )
-
-                    csrf_tokens_match = compare_digest(
-                        decoded_crsf_cookie, decoded_crsf_token
-                    )
-
-                except Exception:
-                    await ctx.log(Event(
-                        level=LogLevel.ERROR,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Rejecting request and could not verify CRSF token'
-                    ))
-
-                    csrf_tokens_match = False
-
-                crsf_match_failed = (
-                    crsf_cookie is None
-                    or submitted_csrf_token is None
-                    or csrf_tokens_match is False
-                )
-
-                if crsf_match_failed:
+                if self._verify_token(crsf_cookie, submitted_csrf_token) is False:
                     context.status = 403
                     await ctx.log(Event(
                         level=LogLevel.ERROR,
@@ -144,72 +146,119 @@ class CRSF(Middleware):
                         "CSRF token verification failed",
                     ), False
 
-            crsf_cookie = cookies.get(self.cookie_name)
-
             response_headers = {}
 
             if crsf_cookie is None:
 
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Creating CRSF token'
-                ))
+                if debug:
+                    await ctx.log(Event(
+                        level=LogLevel.DEBUG,
+                        message=log_prefix + 'Creating CRSF token'
+                    ))
                 
-                cookie: BaseCookie = SimpleCookie()
-                cookie_name = self.cookie_name
-
                 crsf_token = self.encryptor.encrypt(
                     token_urlsafe(nbytes=self.secret_bytes_size).encode()
                 )
 
-                cookie[cookie_name] = b64encode(
-                    self._compressor.compress(crsf_token)
-                ).decode()
+                # The encrypted token is random, so compressing it only
+                # adds framing overhead - encode the ciphertext as is.
+                crsf_cookie = urlsafe_b64encode(crsf_token).decode()
+
+                if debug:
+                    await ctx.log(Event(
+                        level=LogLevel.DEBUG,
+                        message=log_prefix + 'Adding CRSF token to headers'
+                    ))
 
-                cookie[cookie_name]["path"] = self.cookie_path
-                cookie[cookie_name]["secure"] = self.cookie_secure
-                cookie[cookie_name]["httponly"] = self.cookie_httponly
-                cookie[cookie_name]["samesite"] = self.cookie_samesite
+                response_headers["set-cookie"] = f"{self.cookie_name}={crsf_cookie}; {self._cookie_attributes}"
 
-                if self.cookie_domain is not None:
-                    cookie[cookie_name]["domain"] = self.cookie_domain  # pragma: no cover
+            context.response_headers.update(response_headers)
 
+            if debug:
                 await ctx.log(Event(
                     level=LogLevel.DEBUG,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Adding CRSF token to headers'
+                    message=log_prefix + 'Request met CRSF validation requirements'
                 ))
 
-                response_headers["set-cookie"] = cookie.output(header="").strip()
-
-            context.response_headers.update(response_headers)
-
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Request met CRSF validation requirements'
-            ))
-
             return (
                 context,
                 response,
             ), True
 
     def _has_sensitive_cookies(self, cookies: Dict[str, str]) -> bool:
-        for sensitive_cookie in self.sensitive_cookies:
-            if cookies.get(sensitive_cookie) is not None:
-                return True
-
-        return False
+        return not self._sensitive_cookies.isdisjoint(cookies)
 
     def _path_is_required(self, path: str) -> bool:
-        for required_url in self.required_paths:
-            if required_url in path:
+        # Paths match anywhere in the request path (not just as a prefix),
+        # so this can't be collapsed into a single startswith() call.
+        for required_path in self._required_paths:
+            if required_path in path:
                 return True
 
         return False
 
     def _path_is_exempt(self, path: str) -> bool:
-        for exempt_path in self.exempt_paths:
+        for exempt_path in self._exempt_paths:
             if exempt_path in path:
                 return True
 
         return False
+
+    def _verify_token(
+        self,
+        crsf_cookie: str | None,
+        submitted_csrf_token: str | None,
+    ) -> bool:
+        if not crsf_cookie or not submitted_csrf_token:
+            return False
+
+        try:
+            # Double-submit clients echo the cookie back verbatim, and
+            # byte-equal ciphertexts decrypt to the same token, so the
+            # common case only needs to decrypt once.
+            tokens_identical = compare_digest(crsf_cookie, submitted_csrf_token)
+
+        except TypeError:
+            # compare_digest() rejects non-ASCII str, which can't be
+            # a token we issued anyway.
+            return False
+
+        try:
+            encrypted_cookie = urlsafe_b64decode(crsf_cookie)
+
+        except (binascii.Error, ValueError):
+            return False
+
+        # Anything shorter than the key, nonce and GCM tag can't be a
+        # token we issued, so skip the decrypt attempt entirely.
+        if len(encrypted_cookie) < _MIN_TOKEN_SIZE:
+            return False
+
+        try:
+            decoded_crsf_cookie = self.encryptor.decrypt(encrypted_cookie)
+
+        except InvalidTag:
+            return False
+
+        if tokens_identical:
+            return True
+
+        try:
+            encrypted_token = urlsafe_b64decode(submitted_csrf_token)
+
+        except (binascii.Error, ValueError):
+            return False
+
+        if len(encrypted_token) < _MIN_TOKEN_SIZE:
+            return False
+
+        try:
+            decoded_crsf_token = self.encryptor.decrypt(encrypted_token)
+
+        except InvalidTag:
+            return False
+
+        return compare_digest(
+            decoded_crsf_cookie,
+            decoded_crsf_token,
+        )
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import zstandard
+
+from mkfst.logging import Logger
+from mkfst.middleware.base import Middleware, MiddlewareType
+
+from .decompress_zstd import decompress_zstd
+
+
+class BaseZStandardDecompressor(Middleware):
+    def __init__(
+        self,
+        name: str,
+        middleware_type: MiddlewareType = MiddlewareType.UNIDIRECTIONAL_AFTER,
+        offload_size: int = 2048,
+        legacy_b64: bool = False,
+        max_window_size: int = 1 << 23,
+        dict_data: zstandard.ZstdCompressionDict | bytes | None = None,
+    ) -> None:
+        super().__init__(
+            name,
+            middleware_type=middleware_type,
+        )
+
+        self.offload_size = offload_size
+        self.legacy_b64 = legacy_b64
+        self.max_window_size = max_window_size
+
+        if isinstance(dict_data, bytes):
+            dict_data = zstandard.ZstdCompressionDict(dict_data)
+
+        # Frames compressed with a dictionary can only be decompressed
+        # with the same one, so this must match the sending compressor's.
+        self.dictionary = dict_data
+
+        self._decompressors = threading.local()
+        self._logger = Logger()
+
+    def _get_decompressor(self) -> zstandard.ZstdDecompressor:
+        # Reuse one decompression context per thread - contexts are
+        # expensive to set up but can't be shared between threads.
+        decompressor: zstandard.ZstdDecompressor | None = getattr(
+            self._decompressors,
+            'decompressor',
+            None,
+        )
+
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor(
+                dict_data=self.dictionary,
+                max_window_size=self.max_window_size,
+            )
+            self._decompressors.decompressor = decompressor
+
+        return decompressor
+
+    def load_dictionary(self, path: str):
+        with open(path, 'rb') as dictionary_file:
+            self.dictionary = zstandard.ZstdCompressionDict(
+                dictionary_file.read()
+            )
+
+        # Discard decompressors built without the dictionary.
+        self._decompressors = threading.local()
+
+    def _decompress_data(
+        self,
+        data: bytes,
+        max_output_size: int = 0,
+    ) -> bytes:
+        return decompress_zstd(
+            self._get_decompressor(),
+            data,
+            max_output_size=max_output_size,
+        )
+
+    async def _decompress(
+        self,
+        data: bytes,
+        max_output_size: int = 0,
+    ) -> bytes:
+        if len(data) > self.offload_size:
+            # zstd drops the GIL while it works, so large bodies can
+            # decompress on a worker thread while other requests run.
+            return await asyncio.to_thread(
+                self._decompress_data,
+                data,
+                max_output_size,
+            )
+
+        return self._decompress_data(
+            data,
+            max_output_size=max_output_size,
+        )
@@ -1,10 +1,26 @@
-from base64 import b64decode
-from gzip import decompress
 from typing import (
     Any,
+    Callable,
     Dict,
 )
 
+try:
+    # pybase64 uses SIMD kernels that are several times faster than
+    # the stdlib for larger payloads.
+    from pybase64 import b64decode
+
+except ImportError:
+    from base64 import b64decode
+
+try:
+    # ISA-L's SIMD inflate is several times faster than stdlib zlib.
+    from isal.igzip import decompress
+    from isal.isal_zlib import decompress as zlib_decompress
+
+except ImportError:
+    from gzip import decompress
+    from zlib import decompress as zlib_decompress
+
 from mkfst.logging import Logger, LogLevel
 from mkfst.middleware.base import Middleware, MiddlewareType
 from mkfst.middleware.base.response_context import ResponseContext
@@ -21,6 +37,12 @@ class BidirectionalGZipDecompressor(Middleware):
         )
         self._logger = Logger()
 
+        # The gzip compressors can also emit zlib-framed "deflate" bodies.
+        self._decompressors: Dict[str, Callable[[bytes], bytes]] = {
+            "gzip": decompress,
+            "deflate": zlib_decompress,
+        }
+
     async def __pre__(
         self,
         context: ResponseContext | None = None,
@@ -30,11 +52,18 @@ class BidirectionalGZipDecompressor(Middleware):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing request via GZip'
-            ))
+            if debug:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + 'Decompressing request via GZip'
+                ))
             
             decompressed_data = b''
             try:
@@ -48,22 +77,25 @@ class BidirectionalGZipDecompressor(Middleware):
                 content_encoding = headers.get(
                     "content-encoding", headers.get("x-compression-encoding")
                 )
+                decompress_data = self._decompressors.get(content_encoding)
+
+                if data != b"" and decompress_data is not None:
+                    decompressed_data = decompress_data(data)
 
-                if data != b"" and content_encoding == "gzip":
-                    decompressed_data = decompress(data)
+                    # headers is our own model_dump() copy, so strip the
+                    # encoding headers in place rather than rebuilding it.
+                    headers.pop("content-encoding", None)
+                    headers.pop("x-compression-encoding", None)
 
-                    context.update_request_headers({
-                        key: value
-                        for key, value in headers.items()
-                        if key != "content-encoding" and key != "x-compression-encoding"
-                    })
+                    context.update_request_headers(headers)
 
                     context.update_request_data(decompressed_data)
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed request via GZip'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed request via GZip'
+                        ))
 
                 else:
                     await ctx.log(Event(
@@ -100,12 +132,19 @@ class BidirectionalGZipDecompressor(Middleware):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
             try:
                 content_encoding = context.response_headers.get(
                     "content-encoding", 
                     context.response_headers.get("x-compression-encoding")
                 )
+                decompress_data = self._decompressors.get(content_encoding)
 
                 if response is None:
                     await ctx.log(Event(
@@ -119,45 +158,69 @@ class BidirectionalGZipDecompressor(Middleware):
                     ), True
 
 
-                elif content_encoding != "gzip":
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No content-encoding header - skipping decompression'
-                    ))
+                elif decompress_data is None:
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'No content-encoding header - skipping decompression'
+                        ))
 
                     return (
                         context,
                         response
                     ), True
 
-                if isinstance(response, str):
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing string response via GZip'
-                    ))
-
-                    decompressed_data = decompress(
-                        b64decode(response.encode())
+                if isinstance(response, (bytes, bytearray, memoryview)):
+                    # The compressors emit raw compressed bytes, so there's
+                    # nothing to serialize or base64 decode.
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing bytes response via GZip'
+                        ))
+
+                    decompressed_data = decompress_data(response)
+
+                    context.response_headers.pop("content-encoding", None)
+                    context.response_headers.pop("x-compression-encoding", None)
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip'
+                        ))
+
+                elif isinstance(response, str):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing string response via GZip'
+                        ))
+
+                    decompressed_data = decompress_data(
+                        b64decode(response)
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via GZip'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip'
+                        ))
 
                 else:
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing response via GZip'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing response via GZip'
+                        ))
 
                     serialized: str = parse_response(
                         response,
                         context.parser
                     )
 
-                    decompressed_data = decompress(
-                        b64decode(serialized.encode())
+                    decompressed_data = decompress_data(
+                        b64decode(serialized)
                     )
 
                     context.response_headers.pop(
@@ -165,10 +228,11 @@ class BidirectionalGZipDecompressor(Middleware):
                         context.response_headers.pop("x-compression-encoding")
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via GZip with level'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip with level'
+                        ))
 
                 return (
                     context,
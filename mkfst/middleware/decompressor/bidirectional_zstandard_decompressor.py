@@ -1,4 +1,3 @@
-from base64 import b64decode
 from typing import (
     Any,
     Dict,
@@ -6,75 +5,106 @@ from typing import (
 
 import zstandard
 
-from mkfst.logging import Logger, LogLevel
-from mkfst.middleware.base import Middleware, MiddlewareType
+try:
+    from pybase64 import b64decode
+
+except ImportError:
+    from base64 import b64decode
+
+from mkfst.logging import LogLevel
+from mkfst.middleware.base import MiddlewareType
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
 from mkfst.models.http.parse_response import parse_response
 from mkfst.models.logging import Event
 
+from .base_zstandard_decompressor import BaseZStandardDecompressor
 
-class BidirectionalZStandardDecompressor(Middleware):
-    def __init__(self) -> None:
+
+class BidirectionalZStandardDecompressor(BaseZStandardDecompressor):
+    def __init__(
+        self,
+        offload_size: int = 2048,
+        legacy_b64: bool = False,
+        max_window_size: int = 1 << 23,
+        dict_data: zstandard.ZstdCompressionDict | bytes | None = None,
+    ) -> None:
         super().__init__(
-            self.__class__.__name__, 
-            middleware_type=MiddlewareType.BIDIRECTIONAL
+            self.__class__.__name__,
+            middleware_type=MiddlewareType.BIDIRECTIONAL,
+            offload_size=offload_size,
+            legacy_b64=legacy_b64,
+            max_window_size=max_window_size,
+            dict_data=dict_data,
         )
 
-        self._decompressor = zstandard.ZstdDecompressor()
-        self._logger = Logger()
-
     async def __pre__(
         self,
         context: ResponseContext | None = None,
         response: Any | None = None,
         handler: MiddlewareHandler | Handler | None = None,
     ) -> MiddlewareResult:
+        headers_model = context.get_headers()
+        data = context.get_bytes_arg()
+
+        headers: Dict[str, Any] = {}
+        if headers_model:
+            headers = headers_model.model_dump()
+
+        content_encoding = headers.get(
+            "content-encoding", 
+            context.request_headers.get("x-compression-encoding")
+        )
+
+        # Most traffic isn't zstd encoded, so hand it straight on
+        # without paying for a logging context.
+        if not data or content_encoding != "zstd":
+            return (
+                context,
+                response
+            ), True
+
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing request via ZStd'
-            ))
+            if debug:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + 'Decompressing request via ZStd'
+                ))
             
-            decompressed_data = b''
             try:
-                headers_model = context.get_headers()
-                data = context.get_bytes_arg()
-
-                headers: Dict[str, Any] = {}
-                if headers_model:
-                    headers = headers_model.model_dump()
+                original_length = str(
+                    context.request_headers.get("x-original-length", "")
+                )
 
-                content_encoding = headers.get(
-                    "content-encoding", 
-                    context.request_headers.get("x-compression-encoding")
+                decompressed_data = await self._decompress(
+                    data,
+                    max_output_size=(
+                        int(original_length)
+                        if original_length.isdigit()
+                        else 0
+                    ),
                 )
 
-                if data != b"" and content_encoding == "zstd":
-                    decompressed_data = self._decompressor.decompress(
-                        data
-                    )
+                headers.pop("content-encoding", None)
+                headers.pop("x-compression-encoding", None)
 
-                    context.update_request_headers({
-                        key: value
-                        for key, value in headers.items()
-                        if key != "content-encoding" and key != "x-compression-encoding"
-                    })
+                context.update_request_headers(headers)
 
-                    context.update_request_data(decompressed_data)
+                context.update_request_data(decompressed_data)
 
+                if debug:
                     await ctx.log(Event(
                         level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed request via ZStd'
-                    ))
-                
-                else:
-                    await ctx.log(Event(
-                        level=LogLevel.WARN,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No request to decompress'
+                        message=log_prefix + 'Decompressed request via ZStd'
                     ))
 
                 return (
@@ -88,7 +118,13 @@ class BidirectionalZStandardDecompressor(Middleware):
 
                 await ctx.log(Event(
                     level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error ZStd decompressing request - {str(e)}'
+                    message='Request - %s %s:%s - Encountered error ZStd decompressing request - %s',
+                    message_args=(
+                        context.method,
+                        context.path,
+                        context.ip_address,
+                        e,
+                    ),
                 ))
 
                 return (
@@ -102,61 +138,88 @@ class BidirectionalZStandardDecompressor(Middleware):
         response: Any | None = None,
         handler: MiddlewareHandler | Handler | None = None,
     ) -> MiddlewareResult:
+        content_encoding = context.response_headers.get(
+            "content-encoding", 
+            context.response_headers.get("x-compression-encoding")
+        )
+
+        if response is None or content_encoding != "zstd":
+            return (
+                context,
+                response
+            ), True
         
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
             try:
-                content_encoding = context.response_headers.get(
-                    "content-encoding", 
-                    context.response_headers.get("x-compression-encoding")
-                )
-                
-                if response is None:
-                    return (
-                        context,
-                        response
-                    ), True
-                
-                elif content_encoding != "zstd":
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No content-encoding header - skipping decompression'
-                    ))
+                if isinstance(response, (bytes, bytearray, memoryview)):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing bytes response via ZStd'
+                        ))
+
+                    decompressed_data = await self._decompress(response)
+
+                    context.response_headers.pop("content-encoding", None)
+                    context.response_headers.pop("x-compression-encoding", None)
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd'
+                        ))
+
+                elif isinstance(response, str):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing string response via ZStd'
+                        ))
+
+                    decompressed_data = await self._decompress(
+                        response.encode()
+                    )
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd'
+                        ))
+
+                elif self.legacy_b64 is False:
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Response is not compressed bytes - skipping decompression'
+                        ))
 
                     return (
                         context,
                         response
                     ), True
 
-                
-                if isinstance(response, str):
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing string response via ZStd'
-                    ))
-
-                    decompressed_data = self._decompressor.decompress(response.encode())
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via ZStd'
-                    ))
-
                 else:
-                    
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing response via ZStd'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing base64 encoded response via ZStd'
+                        ))
 
                     serialized: str = parse_response(
                         response,
                         context.parser
                     )
-                    decompressed_data = self._decompressor.decompress(
-                        b64decode(serialized.encode())
+                    decompressed_data = await self._decompress(
+                        b64decode(serialized)
                     )
 
                     context.response_headers.pop(
@@ -164,10 +227,11 @@ class BidirectionalZStandardDecompressor(Middleware):
                         context.response_headers.pop("x-compression-encoding")
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via ZStd with level'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd with level'
+                        ))
 
                 return (
                     context,
@@ -180,7 +244,13 @@ class BidirectionalZStandardDecompressor(Middleware):
 
                 await ctx.log(Event(
                     level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error ZStd decompressing request - {str(e)}'
+                    message='Request - %s %s:%s - Encountered error ZStd decompressing request - %s',
+                    message_args=(
+                        context.method,
+                        context.path,
+                        context.ip_address,
+                        e,
+                    ),
                 ))
 
                 return (
@@ -0,0 +1,36 @@
+import zstandard
+
+# Frames that record a content size up to this limit are
+# decompressed in a single call.
+ONE_SHOT_SIZE = 16 * 1024 * 1024
+
+
+def decompress_zstd(
+    decompressor: zstandard.ZstdDecompressor,
+    data: bytes,
+    max_output_size: int = 0,
+) -> bytes:
+    content_size = zstandard.frame_content_size(data)
+    if 0 <= content_size <= ONE_SHOT_SIZE:
+        return decompressor.decompress(data)
+
+    elif content_size < 0 and 0 < max_output_size <= ONE_SHOT_SIZE:
+        # The sender told us how large the output is, so zstd can
+        # decompress into a single buffer of that size (and errors
+        # if the frame turns out to be any larger).
+        return decompressor.decompress(
+            data,
+            max_output_size=max_output_size,
+        )
+
+    # Stream-compressed frames don't record their content size, which
+    # one-shot decompress() rejects, so feed them through a streaming
+    # decompressor in input-sized windows instead.
+    decompressobj = decompressor.decompressobj(read_across_frames=True)
+    window_size = zstandard.DECOMPRESSION_RECOMMENDED_INPUT_SIZE
+    view = memoryview(data)
+
+    return b"".join([
+        decompressobj.decompress(view[offset:offset + window_size])
+        for offset in range(0, len(view), window_size)
+    ])
@@ -1,6 +1,22 @@
-from base64 import b64decode
-from gzip import decompress
-from typing import Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+try:
+    from pybase64 import b64decode
+
+except ImportError:
+    from base64 import b64decode
+
+try:
+    from isal.igzip import decompress
+    from isal.isal_zlib import decompress as zlib_decompress
+
+except ImportError:
+    from gzip import decompress
+    from zlib import decompress as zlib_decompress
 
 from mkfst.logging import Logger, LogLevel
 from mkfst.middleware.base import Middleware, MiddlewareType
@@ -17,6 +33,12 @@ class GZipDecompressor(Middleware):
         )
         self._logger = Logger()
 
+        # The gzip compressors can also emit zlib-framed "deflate" bodies.
+        self._decompressors: Dict[str, Callable[[bytes], bytes]] = {
+            "gzip": decompress,
+            "deflate": zlib_decompress,
+        }
+
     async def __run__(
         self,
         context: ResponseContext | None = None,
@@ -27,12 +49,19 @@ class GZipDecompressor(Middleware):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
             try:
                 content_encoding = context.response_headers.get(
                     "content-encoding", 
                     context.response_headers.get("x-compression-encoding")
                 )
+                decompress_data = self._decompressors.get(content_encoding)
 
                 if response is None:
                     await ctx.log(Event(
@@ -46,45 +75,69 @@ class GZipDecompressor(Middleware):
                     ), True
 
 
-                elif content_encoding != "gzip":
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No content-encoding header - skipping decompression'
-                    ))
+                elif decompress_data is None:
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'No content-encoding header - skipping decompression'
+                        ))
 
                     return (
                         context,
                         response
                     ), True
 
-                if isinstance(response, str):
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing string response via GZip'
-                    ))
-
-                    decompressed_data = decompress(
-                        b64decode(response.encode())
+                if isinstance(response, (bytes, bytearray, memoryview)):
+                    # The compressors emit raw compressed bytes, so there's
+                    # nothing to serialize or base64 decode.
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing bytes response via GZip'
+                        ))
+
+                    decompressed_data = decompress_data(response)
+
+                    context.response_headers.pop("content-encoding", None)
+                    context.response_headers.pop("x-compression-encoding", None)
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip'
+                        ))
+
+                elif isinstance(response, str):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing string response via GZip'
+                        ))
+
+                    decompressed_data = decompress_data(
+                        b64decode(response)
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via GZip'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip'
+                        ))
 
                 else:
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing response via GZip'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing response via GZip'
+                        ))
 
                     serialized: str = parse_response(
                         response,
                         context.parser
                     )
 
-                    decompressed_data = decompress(
-                        b64decode(serialized.encode())
+                    decompressed_data = decompress_data(
+                        b64decode(serialized)
                     )
 
                     context.response_headers.pop(
@@ -92,10 +145,11 @@ class GZipDecompressor(Middleware):
                         context.response_headers.pop("x-compression-encoding")
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via GZip with level'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via GZip with level'
+                        ))
 
                 return (
                     context,
@@ -1,86 +1,128 @@
-from base64 import b64decode
 from typing import Any
 
 import zstandard
 
-from mkfst.logging import Logger, LogLevel
-from mkfst.middleware.base import Middleware, MiddlewareType
+try:
+    from pybase64 import b64decode
+
+except ImportError:
+    from base64 import b64decode
+
+from mkfst.logging import LogLevel
+from mkfst.middleware.base import MiddlewareType
 from mkfst.middleware.base.response_context import ResponseContext
 from mkfst.middleware.base.types import Handler, MiddlewareHandler, MiddlewareResult
 from mkfst.models.http.parse_response import parse_response
 from mkfst.models.logging import Event
 
+from .base_zstandard_decompressor import BaseZStandardDecompressor
+
 
-class ZStandardDecompressor(Middleware):
-    def __init__(self) -> None:
+class ZStandardDecompressor(BaseZStandardDecompressor):
+    def __init__(
+        self,
+        offload_size: int = 2048,
+        legacy_b64: bool = False,
+        max_window_size: int = 1 << 23,
+        dict_data: zstandard.ZstdCompressionDict | bytes | None = None,
+    ) -> None:
         super().__init__(
-            self.__class__.__name__, middleware_type=MiddlewareType.UNIDIRECTIONAL_AFTER
+            self.__class__.__name__,
+            middleware_type=MiddlewareType.UNIDIRECTIONAL_AFTER,
+            offload_size=offload_size,
+            legacy_b64=legacy_b64,
+            max_window_size=max_window_size,
+            dict_data=dict_data,
         )
 
-        self._decompressor = zstandard.ZstdDecompressor()
-        self._logger = Logger()
-
     async def __run__(
         self,
         context: ResponseContext | None = None,
         response: Any | None = None,
         handler: MiddlewareHandler | Handler | None = None,
     ) -> MiddlewareResult:
+        content_encoding = context.response_headers.get(
+            "content-encoding", 
+            context.response_headers.get("x-compression-encoding")
+        )
+
+        if response is None or content_encoding != "zstd":
+            return (
+                context,
+                response
+            ), True
         
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
+            debug = self._logger.enabled(LogLevel.DEBUG)
+            log_prefix = (
+                f'Request - {context.method} {context.path}:{context.ip_address} - '
+                if debug
+                else ''
+            )
             
             try:
-                content_encoding = context.response_headers.get(
-                    "content-encoding", 
-                    context.response_headers.get("x-compression-encoding")
-                )
-                
-                if response is None:
-                    return (
-                        context,
-                        response
-                    ), True
-                
-                elif content_encoding != "zstd":
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - No content-encoding header - skipping decompression'
-                    ))
+                if isinstance(response, (bytes, bytearray, memoryview)):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing bytes response via ZStd'
+                        ))
+
+                    decompressed_data = await self._decompress(response)
+
+                    context.response_headers.pop("content-encoding", None)
+                    context.response_headers.pop("x-compression-encoding", None)
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd'
+                        ))
+
+                elif isinstance(response, str):
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing string response via ZStd'
+                        ))
+
+                    decompressed_data = await self._decompress(
+                        response.encode()
+                    )
+
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd'
+                        ))
+
+                elif self.legacy_b64 is False:
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Response is not compressed bytes - skipping decompression'
+                        ))
 
                     return (
                         context,
                         response
                     ), True
 
-                
-                if isinstance(response, str):
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing string response via ZStd'
-                    ))
-
-                    decompressed_data = self._decompressor.decompress(response.encode())
-
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via ZStd'
-                    ))
-
                 else:
-                    
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressing response via ZStd'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressing base64 encoded response via ZStd'
+                        ))
 
                     serialized: str = parse_response(
                         response,
                         context.parser
                     )
-                    decompressed_data = self._decompressor.decompress(
-                        b64decode(serialized.encode())
+                    decompressed_data = await self._decompress(
+                        b64decode(serialized)
                     )
 
                     context.response_headers.pop(
@@ -88,10 +130,11 @@ class ZStandardDecompressor(Middleware):
                         context.response_headers.pop("x-compression-encoding")
                     )
 
-                    await ctx.log(Event(
-                        level=LogLevel.DEBUG,
-                        message=f'Request - {context.method} {context.path}:{context.ip_address} - Decompressed response via ZStd with level'
-                    ))
+                    if debug:
+                        await ctx.log(Event(
+                            level=LogLevel.DEBUG,
+                            message=log_prefix + 'Decompressed response via ZStd with level'
+                        ))
 
                 return (
                     context,
@@ -104,7 +147,13 @@ class ZStandardDecompressor(Middleware):
 
                 await ctx.log(Event(
                     level=LogLevel.ERROR,
-                    message=f'Request - {context.method} {context.path}:{context.ip_address} - Encountered error ZStd decompressing request - {str(e)}'
+                    message='Request - %s %s:%s - Encountered error ZStd decompressing request - %s',
+                    message_args=(
+                        context.method,
+                        context.path,
+                        context.ip_address,
+                        e,
+                    ),
                 ))
 
                 return (
@@ -6,6 +6,7 @@ from .http_request import HTTPRequestMethod as HTTPRequestMethod
 from .http_response import HTTPResponse as HTTPResponse
 from .limit import Limit as Limit
 from .parse_response import parse_response as parse_response
+from .parse_response import parse_response_bytes as parse_response_bytes
 from .request_models import Body as Body
 from .request_models import Cookies as Cookies
 from .request_models import Headers as Headers
@@ -1,8 +1,10 @@
 import asyncio
 import functools
-from typing import Literal
+import io
+import os
+from typing import ClassVar, Literal, Set
 
-from pydantic import BaseModel, StrictBytes, StrictStr
+from pydantic import BaseModel, PrivateAttr, StrictBytes, StrictStr
 
 
 class FileUpload(BaseModel):
@@ -10,6 +12,89 @@ class FileUpload(BaseModel):
     content_type: StrictStr | None = None
     encoding: StrictStr | None = None
 
+    _path: str | None = PrivateAttr(default=None)
+
+    # Subclasses register themselves as they're defined, so response
+    # parsing can test membership without walking __subclasses__().
+    subclasses: ClassVar[Set[type]] = set()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        FileUpload.subclasses.add(cls)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        content_type: str | None = None,
+    ):
+        # The file stays on disk and is sent via sendfile_to() when
+        # returned from a handler, rather than being read into data.
+        upload = cls.model_construct(
+            data=b'',
+            content_type=content_type,
+        )
+        upload._path = path
+
+        return upload
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    def read_path(self) -> bytes:
+        return self._upload(
+            self._path,
+            read_type='binary',
+        )
+
+    async def sendfile_to(self, transport: asyncio.Transport) -> int:
+        upload_file = await asyncio.to_thread(
+            open,
+            self._path,
+            'rb',
+        )
+
+        try:
+            # Uses os.sendfile() where the transport supports it, so
+            # the file goes from the page cache to the socket without
+            # a userspace copy.
+            return await asyncio.get_running_loop().sendfile(
+                transport,
+                upload_file,
+            )
+
+        except (NotImplementedError, RuntimeError):
+            # uvloop doesn't implement loop.sendfile(), and by now the
+            # response head is already out, so write the rest of the
+            # file (from wherever sendfile left off) in chunks instead.
+            return await self._write_chunks_to(
+                transport,
+                upload_file,
+            )
+
+        finally:
+            upload_file.close()
+
+    async def _write_chunks_to(
+        self,
+        transport: asyncio.Transport,
+        upload_file: io.BufferedReader,
+    ) -> int:
+        total_sent = 0
+
+        while chunk := await asyncio.to_thread(
+            upload_file.read,
+            65536,
+        ):
+            if transport.is_closing():
+                break
+
+            transport.write(chunk)
+            total_sent += len(chunk)
+
+        return total_sent
+
     async def upload(
         self, 
         path: str, 
@@ -23,7 +108,7 @@ class FileUpload(BaseModel):
             )
         )
 
-        return FileUpload(
+        return FileUpload.model_construct(
             data=upload_file
         )
 
@@ -32,11 +117,22 @@ class FileUpload(BaseModel):
         path: str, 
         read_type: Literal['string', 'binary']='string',
     ):
-        
-        read_mode = 'r'
+        # Read straight from the file descriptor, skipping the buffered
+        # and text I/O layers open() wraps around it.
+        fd = os.open(path, os.O_RDONLY)
+
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+
+            # Short reads (or files that don't report a size) fall
+            # back to reading the rest until EOF.
+            while chunk := os.read(fd, 65536):
+                data += chunk
+
+        finally:
+            os.close(fd)
+
         if read_type == 'binary':
-            read_mode = 'rb'
+            return data
 
-        with open(path, read_mode) as upload_file:
-            return upload_file.read()
-         
\ No newline at end of file
+        return data.decode(self.encoding or 'utf-8')
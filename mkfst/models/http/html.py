@@ -1,10 +1,22 @@
+import functools
 import textwrap
 
 from pydantic import BaseModel, StrictStr
 
 
+@functools.lru_cache(maxsize=256)
+def _dedent_cached(content: str) -> str:
+    return textwrap.dedent(content)
+
+
 class HTML(BaseModel):
     content: StrictStr
 
     def format(self):
-        return textwrap.dedent(self.content)
\ No newline at end of file
+        # Handlers and the docs pages usually serve the same markup on
+        # every request, so remember the dedented result for anything
+        # short of a very large page.
+        if len(self.content) > 65536:
+            return textwrap.dedent(self.content)
+
+        return _dedent_cached(self.content)
@@ -1,5 +1,5 @@
+import functools
 import inspect
-from base64 import b64encode
 from gzip import compress as gzip_compress
 from typing import Dict, Literal, Optional, Union
 
@@ -9,6 +9,59 @@ from zstandard import compress as zstd_compress
 
 from mkfst.models.base.message import Message
 
+# Only small payloads (error pages and other canned responses) are
+# worth remembering - large bodies would just churn the cache.
+MAX_CACHED_PAYLOAD_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _compress_cached(
+    payload: bytes,
+    compression: Literal['gzip', 'zstd'],
+    compression_level: int | None,
+) -> bytes:
+    return _compress(
+        payload,
+        compression,
+        compression_level,
+    )
+
+
+def _compress(
+    payload: bytes,
+    compression: Literal['gzip', 'zstd'],
+    compression_level: int | None,
+) -> bytes:
+    if compression == 'gzip':
+        return gzip_compress(
+            payload,
+            compresslevel=compression_level
+        )
+
+    return zstd_compress(
+        payload,
+        level=compression_level
+    )
+
+
+def _compress_payload(
+    payload: bytes,
+    compression: Literal['gzip', 'zstd'],
+    compression_level: int | None,
+) -> bytes:
+    if len(payload) > MAX_CACHED_PAYLOAD_SIZE:
+        return _compress(
+            payload,
+            compression,
+            compression_level,
+        )
+
+    return _compress_cached(
+        payload,
+        compression,
+        compression_level,
+    )
+
 
 class HTTPResponse(BaseModel):
     protocol: StrictStr = "HTTP/1.1"
@@ -34,61 +87,53 @@ class HTTPResponse(BaseModel):
 
         head_line = f"HTTP/1.1 {self.status} {message}"
 
-        encoded_data: str = ""
+        # The body stays bytes from serialization through compression,
+        # so only the (ASCII) head line and headers need encoding below.
+        encoded_data = b""
 
         if isinstance(self.data, Message):
-            encoded_data = orjson.dumps(self.data.to_data()).decode()
-
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
+            encoded_data = orjson.dumps(self.data.to_data())
 
         elif inspect.isclass(self.data) and issubclass(self.data, BaseModel):
-            encoded_data = orjson.dumps(self.data.model_dump()).decode()
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
+            encoded_data = self.data.model_dump_json().encode()
 
         elif isinstance(self.data, (dict, list)):
-            encoded_data = orjson.dumps(self.data).decode()
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
+            encoded_data = orjson.dumps(self.data)
 
         elif self.data:
-            encoded_data = self.data
-
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
-
-        else:
-            headers = "content-length: 0"
-
-        if compression == 'gzip':
-            encoded_data = b64encode(
-                gzip_compress(
-                    encoded_data.encode(), 
-                    compresslevel=compression_level
-                )
-            ).decode()
-            
-            headers = f"{headers}\r\nx-compression-encoding: {compression}"
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
-
-        elif compression == 'zstd':
-            encoded_data = b64encode(
-                zstd_compress(
-                    encoded_data.encode(),
-                    level=compression_level
-                )
-            ).decode()
-
-            headers = f"{headers}\r\nx-compression-encoding: {compression}"
-            content_length = len(encoded_data)
-            headers = f"content-length: {content_length}"
-
+            encoded_data = self.data.encode()
+
+        # Collect header lines and join them once at the end rather
+        # than re-copying the whole header block for every header.
+        header_parts = [
+            f"content-length: {len(encoded_data)}"
+        ]
+
+        # HTTP bodies are 8-bit clean, so send the compressed bytes as-is
+        # under a standard content-encoding rather than base64 encoding them.
+        if compression == 'gzip' or compression == 'zstd':
+            encoded_data = _compress_payload(
+                encoded_data,
+                compression,
+                compression_level,
+            )
+
+            header_parts = [
+                f"content-length: {len(encoded_data)}",
+                f"content-encoding: {compression}",
+            ]
 
         response_headers = self.headers
         if response_headers:
-            for key in response_headers:
-                headers = f"{headers}\r\n{key}: {response_headers[key]}"
-
-        return f"{head_line}\r\n{headers}\r\n\r\n{encoded_data}".encode()
+            header_parts.extend([
+                f"{key}: {value}" for key, value in response_headers.items()
+            ])
+
+        headers = "\r\n".join(header_parts)
+
+        return b"\r\n".join([
+            head_line.encode(),
+            headers.encode(),
+            b"",
+            encoded_data,
+        ])
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Type
+import functools
+from typing import Any, Callable, Dict, Tuple, Type
 
 import orjson
 from pydantic import BaseModel
@@ -6,28 +7,190 @@ from pydantic import BaseModel
 from .file_upload import FileUpload
 from .html import HTML
 
+ResponseModel = Type[BaseModel | FileUpload | HTML | dict | list | str | bytes]
 
-def parse_response(
-    response: BaseModel | Dict[Any, Any] | str, 
-    response_model: Type[BaseModel | FileUpload | HTML | dict | list | str | bytes ],
+
+@functools.lru_cache(maxsize=1024)
+def _is_model(response_model: Type[Any]) -> bool:
+    # A class's bases never change, so the (linear) __subclasses__()
+    # scan only needs to happen once per response model.
+    return response_model in BaseModel.__subclasses__()
+
+
+# Which serializer applies depends only on the response's type and the
+# route's response model, so resolve each pairing once and dispatch
+# through these tables afterwards.
+_serializers: Dict[Tuple[type, Any], Callable[[Any], str]] = {}
+_bytes_serializers: Dict[Tuple[type, Any], Callable[[Any], bytes]] = {}
+
+
+def _format_html(response: HTML) -> str:
+    return response.format()
+
+
+def _dump_json(response: Dict[Any, Any] | list) -> str:
+    return orjson.dumps(response).decode()
+
+
+def _dump_model(response: BaseModel) -> str:
+    # Serialize straight from the model rather than building a
+    # model_dump() dict only to encode it.
+    return response.model_dump_json()
+
+
+def _passthrough(response: Any) -> Any:
+    return response
+
+
+def _resolve_model_serializer(
+    response_model: ResponseModel,
+) -> Callable[[Any], str]:
+    if response_model == dict or response_model == list:
+        return _dump_json
+
+    elif _is_model(response_model):
+        return _dump_model
+
+    return _passthrough
+
+
+def _serialize_file(
+    response: FileUpload | Any,
+    response_model: ResponseModel,
 ) -> str:
+    if isinstance(response, FileUpload) and response.path is not None:
+        return response.read_path().decode(response.encoding or 'utf-8')
 
-    if response_model == HTML or isinstance(response, HTML):
-        return response.format()
-    
     elif (
-        response_model == FileUpload or isinstance(response, FileUpload) 
+        response_model == FileUpload or isinstance(response, FileUpload)
     ) and isinstance(response.data, bytes):
         return response.data.decode(response.encoding)
-    
-    elif response_model in FileUpload.__subclasses__():
+
+    elif response_model in FileUpload.subclasses:
         return response.data
-    
-    elif response_model == dict or response_model == list:
-        return orjson.dumps(response).decode()
-    
-    if response_model in BaseModel.__subclasses__():
-        return orjson.dumps(response.model_dump()).decode()
 
+    return _resolve_model_serializer(response_model)(response)
+
+
+def _resolve_serializer(
+    response_type: type,
+    response_model: ResponseModel,
+) -> Callable[[Any], str]:
+    if response_model == HTML or issubclass(response_type, HTML):
+        return _format_html
+
+    elif (
+        response_model == FileUpload
+        or issubclass(response_type, FileUpload)
+        or response_model in FileUpload.subclasses
+    ):
+        # Whether a file's data is bytes is only known per response.
+        return functools.partial(
+            _serialize_file,
+            response_model=response_model,
+        )
+
+    return _resolve_model_serializer(response_model)
+
+
+def parse_response(
+    response: BaseModel | Dict[Any, Any] | str,
+    response_model: ResponseModel,
+) -> str:
+    key = (type(response), response_model)
+
+    serializer = _serializers.get(key)
+    if serializer is None:
+        serializer = _resolve_serializer(*key)
+        _serializers[key] = serializer
+
+    return serializer(response)
+
+
+def _format_html_bytes(response: HTML) -> bytes:
+    return response.format().encode()
+
+
+def _dump_json_bytes(response: Dict[Any, Any] | list) -> bytes:
+    return orjson.dumps(response)
+
+
+def _dump_model_bytes(response: BaseModel) -> bytes:
+    return response.__pydantic_serializer__.to_json(response)
+
+
+def _encode_str(response: str | Any) -> bytes | Any:
+    if isinstance(response, str):
+        return response.encode()
 
     return response
+
+
+def _resolve_model_bytes_serializer(
+    response_model: ResponseModel,
+) -> Callable[[Any], bytes]:
+    if response_model == dict or response_model == list:
+        return _dump_json_bytes
+
+    elif _is_model(response_model):
+        return _dump_model_bytes
+
+    return _encode_str
+
+
+def _serialize_file_bytes(
+    response: FileUpload | Any,
+    response_model: ResponseModel,
+) -> bytes:
+    # Files backed by a path are normally streamed with sendfile, but
+    # anything that needs the body in memory (i.e. compression) has
+    # to read them.
+    if isinstance(response, FileUpload) and response.path is not None:
+        return response.read_path()
+
+    elif (
+        response_model == FileUpload or isinstance(response, FileUpload)
+    ) and isinstance(response.data, bytes):
+        return response.data
+
+    elif response_model in FileUpload.subclasses:
+        return _encode_str(response.data)
+
+    return _resolve_model_bytes_serializer(response_model)(response)
+
+
+def _resolve_bytes_serializer(
+    response_type: type,
+    response_model: ResponseModel,
+) -> Callable[[Any], bytes]:
+    if response_model == HTML or issubclass(response_type, HTML):
+        return _format_html_bytes
+
+    elif (
+        response_model == FileUpload
+        or issubclass(response_type, FileUpload)
+        or response_model in FileUpload.subclasses
+    ):
+        return functools.partial(
+            _serialize_file_bytes,
+            response_model=response_model,
+        )
+
+    return _resolve_model_bytes_serializer(response_model)
+
+
+def parse_response_bytes(
+    response: BaseModel | Dict[Any, Any] | str | bytes,
+    response_model: ResponseModel,
+) -> bytes:
+    # Same dispatch as parse_response() but serializes straight to
+    # bytes, skipping the decode()/encode() round trip for callers
+    # (i.e. compressors) that need bytes anyway.
+    key = (type(response), response_model)
+
+    serializer = _bytes_serializers.get(key)
+    if serializer is None:
+        serializer = _resolve_bytes_serializer(*key)
+        _bytes_serializers[key] = serializer
+
+    return serializer(response)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from http.cookies import SimpleCookie
+from types import NoneType, UnionType
+from urllib.parse import unquote_plus
 from typing import (
+    Annotated,
     Any,
     Dict,
     List,
     Type,
+    Union,
+    get_args,
+    get_origin,
 )
 
 import orjson
@@ -16,32 +22,111 @@ from pydantic import (
     StrictFloat,
     StrictInt,
     StrictStr,
-    root_validator,
 )
 
 HTTPEncodable = StrictStr | StrictInt | StrictBool | StrictFloat | None
 
+# Lowercases header names and maps dashes to underscores (so they line
+# up with model field names) in a single pass over the raw bytes.
+HEADER_KEY_TABLE = bytes.maketrans(
+    b"-ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    b"_abcdefghijklmnopqrstuvwxyz",
+)
+
+ENCODABLE_TYPES = (
+    str,
+    int,
+    bytes,
+    bool,
+    float,
+    StrictStr,
+    StrictInt,
+    StrictBool,
+    StrictFloat,
+)
+
+
+def is_encodable_annotation(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        # i.e. StrictStr nested in an Optional or Union.
+        return is_encodable_annotation(get_args(annotation)[0])
+
+    elif origin is Union or origin is UnionType or origin is list:
+        # Optional/Union fields (and repeated query values) are
+        # encodable as long as every member is.
+        return all(
+            arg is NoneType or is_encodable_annotation(arg)
+            for arg in get_args(annotation)
+        )
+
+    return annotation in ENCODABLE_TYPES
+
+
+def validate_encodable_fields(
+    model: Type[BaseModel],
+    exempt: Dict[str, Any] | None = None,
+):
+    # A model's field annotations are fixed once the class exists, so
+    # they're checked as each subclass is defined rather than on every
+    # request that builds one.
+    exempt = exempt or {}
+
+    for field, value in model.model_fields.items():
+        if field in exempt:
+            if value.annotation != exempt[field]:
+                raise TypeError(f"Err. - field {field} must be either str or StrictStr type")
+
+        elif not is_encodable_annotation(value.annotation):
+            raise TypeError(f"Err. - field {field} must have JSON encodable type.")
+
+
+def parse_cookie_header(cookie_header: str) -> Dict[str, str]:
+    # Request cookies are almost always plain "name=value; name=value"
+    # pairs, which don't need SimpleCookie's full RFC grammar (or its
+    # Morsel objects). Quoted-string escapes and $-attributes still go
+    # through SimpleCookie.
+    if "\\" in cookie_header or "$" in cookie_header:
+        parsed_cookies = SimpleCookie()
+        parsed_cookies.load(cookie_header)
+
+        return {
+            name: morsel.value for name, morsel in parsed_cookies.items()
+        }
+
+    cookies: Dict[str, str] = {}
+    for cookie in cookie_header.split(";"):
+        name, sep, value = cookie.partition("=")
+        if sep:
+            value = value.strip()
+            if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+                value = value[1:-1]
+
+            cookies[name.strip()] = value
+
+    return cookies
+
+
+def join_body(
+    data: List[bytes],
+    data_line_idx: int,
+) -> bytes:
+    # Bodies without line breaks (i.e. most JSON) arrive as a single
+    # line, which needs no list slice or join to extract. The body is
+    # returned as sent - stripping it would cost a second pass and
+    # corrupt binary bodies that end in whitespace bytes.
+    if data_line_idx == len(data) - 1:
+        return data[data_line_idx]
+
+    return b''.join(data[data_line_idx:])
+
 
 class Headers(BaseModel):
     
-    @root_validator(pre=True)
-    def validate_headers(cls, val: Type[Headers]):
-
-        encodable_values = [
-            str,
-            int,
-            bytes,
-            bool,
-            float,
-            StrictStr,
-            StrictInt,
-            StrictBool,
-            StrictFloat,
-        ]
-
-        fields = val.model_fields
-        for field, value in fields.items():
-            assert value.annotation in encodable_values, f"Err. - field {field} must have JSON encodable type."
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        validate_encodable_fields(cls)
 
     @classmethod
     def make(
@@ -61,16 +146,19 @@ class Headers(BaseModel):
                     data_line_idx += 1
                     break
 
-                key, value = header_line.decode().split(":", maxsplit=1)
+                separator_idx = header_line.find(b":")
+                if separator_idx < 0:
+                    raise ValueError(f"Err. - malformed header line {header_line!r}")
 
-                headers[key.lower().replace('-', '_')] = value.strip()
+                key = header_line[:separator_idx].translate(HEADER_KEY_TABLE).decode("ascii")
+                headers[key] = header_line[separator_idx + 1:].strip().decode()
 
                 data_line_idx += 1
 
             data_line_idx += 1
 
             return (
-                model(**headers), 
+                model.model_validate(headers),
                 data_line_idx,
                 headers,
             )
@@ -98,9 +186,12 @@ class Headers(BaseModel):
                     data_line_idx += 1
                     break
 
-                key, value = header_line.decode().split(":", maxsplit=1)
+                separator_idx = header_line.find(b":")
+                if separator_idx < 0:
+                    raise ValueError(f"Err. - malformed header line {header_line!r}")
 
-                headers[key.lower().replace('-', '_')] = value.strip()
+                key = header_line[:separator_idx].translate(HEADER_KEY_TABLE).decode("ascii")
+                headers[key] = header_line[separator_idx + 1:].strip().decode()
 
                 data_line_idx += 1
 
@@ -118,29 +209,15 @@ class Headers(BaseModel):
     
 class Cookies(BaseModel):
 
-    @root_validator(pre=True)
-    def validate_headers(cls, val: Type[Query]):
-
-        encodable_values = [
-            str,
-            int,
-            bytes,
-            bool,
-            float,
-            StrictStr,
-            StrictInt,
-            StrictBool,
-            StrictFloat,
-        ]
-
-        fields = val.model_fields
-        for field, value in fields.items():
-
-            if field == 'cookie':
-                assert value.annotation == str, "Err. - field cookie must be either str or StrictStr type"
-
-            else:
-                assert value.annotation in encodable_values, f"Err. - field {field} must have JSON encodable type."
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        validate_encodable_fields(
+            cls,
+            exempt={
+                'cookie': str,
+            },
+        )
 
     @classmethod
     def make(
@@ -154,12 +231,7 @@ class Cookies(BaseModel):
         if cookie_header is None:
             return model()
         
-        parsed_cookies = SimpleCookie()
-        parsed_cookies.load(cookie_header)
-
-        return model(**{
-            name: morsel.value for name, morsel in parsed_cookies.items()
-        })
+        return model.model_validate(parse_cookie_header(cookie_header))
     
     @classmethod
     def make_raw(
@@ -172,56 +244,22 @@ class Cookies(BaseModel):
         if cookie_header is None:
             return 
         
-        parsed_cookies = SimpleCookie()
-        parsed_cookies.load(cookie_header)
-
-        return {
-            name: morsel.value for name, morsel in parsed_cookies.items()
-        }
-        
+        return parse_cookie_header(cookie_header)
 
 
 class Parameters(BaseModel):
 
-    @root_validator(pre=True)
-    def validate_headers(cls, val: Type[Parameters]):
-
-        encodable_values = [
-            str,
-            int,
-            bytes,
-            bool,
-            float,
-            StrictStr,
-            StrictInt,
-            StrictBool,
-            StrictFloat,
-        ]
-
-        fields = val.model_fields
-        for field, value in fields.items():
-            assert value.annotation in encodable_values, f"Err. - field {field} must have JSON encodable type."
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        validate_encodable_fields(cls)
 
 class Query(BaseModel):
 
-    @root_validator(pre=True)
-    def validate_headers(cls, val: Type[Query]):
-
-        encodable_values = [
-            str,
-            int,
-            bytes,
-            bool,
-            float,
-            StrictStr,
-            StrictInt,
-            StrictBool,
-            StrictFloat,
-        ]
-
-        fields = val.model_fields
-        for field, value in fields.items():
-            assert value.annotation in encodable_values, f"Err. - field {field} must have JSON encodable type."
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        validate_encodable_fields(cls)
 
     @classmethod
     def make(
@@ -230,15 +268,26 @@ class Query(BaseModel):
         query: str
     ):
         query_params: Dict[str, str] = {}
-        if len(query) < 1:
-            params = query.split("&")
+        if query:
+            # Most query strings aren't percent-encoded, so only pay
+            # for unquoting when they might be.
+            needs_unquote = "%" in query or "+" in query
 
-            for param in params:
-                key, value = param.split("=")
+            for param in query.split("&"):
+                if not param:
+                    continue
+
+                # partition() keeps any "=" in the value and treats
+                # bare keys (?flag) as empty values.
+                key, _, value = param.partition("=")
+
+                if needs_unquote:
+                    key = unquote_plus(key)
+                    value = unquote_plus(value)
 
                 query_params[key] = value
 
-        return model(**query_params)
+        return model.model_validate(query_params)
 
 
 class Body(BaseModel):
@@ -252,11 +301,9 @@ class Body(BaseModel):
     
 
     def json(self):
-        content = self.content
-        if isinstance(content, bytes):
-            content = self.content.decode()
-
-        return orjson.loads(content)
+        # orjson parses bytes directly, so there's no need to decode
+        # the body to str first.
+        return orjson.loads(self.content)
     
     @classmethod
     def make(
@@ -264,8 +311,10 @@ class Body(BaseModel):
         data: List[bytes],
         data_line_idx: int,
     ):
-        return Body(
-            content=b''.join(data[data_line_idx:]).strip()
+        # The content is always bytes we sliced off the request, so
+        # skip re-validating it.
+        return Body.model_construct(
+            content=join_body(data, data_line_idx)
         )
     
     @classmethod
@@ -275,22 +324,12 @@ class Body(BaseModel):
         data_line_idx: int,
     ):
         if data_line_idx == -1:
-            header_lines = data[1:]
-            data_line_idx = 0
-
-            headers: Dict[str, Any] = {}
-
-            for header_line in header_lines:
-                if header_line == b"":
-                    data_line_idx += 1
-                    break
-
-                key, value = header_line.decode().split(":", maxsplit=1)
+            # Only the body is needed here, so skip to the blank line
+            # ending the headers without parsing them.
+            try:
+                data_line_idx = data.index(b"", 1) + 1
 
-                headers[key.lower()] = value.strip()
-
-                data_line_idx += 1
-
-            data_line_idx += 1
+            except ValueError:
+                data_line_idx = len(data)
 
-        return b''.join(data[data_line_idx:]).strip()
+        return join_body(data, data_line_idx)
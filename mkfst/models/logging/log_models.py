@@ -4,6 +4,14 @@ from mkfst.logging import Entry, LogLevel
 
 JSONEncodableValue = str | int | bool | float | None
 
+
+def _join_pairs(values: Dict[str, JSONEncodableValue] | None) -> str:
+    if not values:
+        return ''
+
+    return ', '.join([f'{key}:{value}' for key, value in values.items()])
+
+
 class Event(Entry, kw_only=True):
     level: LogLevel = LogLevel.INFO
 
@@ -20,33 +28,14 @@ class Request(Entry, kw_only=True):
     error: Exception | str | None = None
     ip_address: str | None = None
 
-    def to_template(
-        self,
-        template: str,
-        context: Dict[str, Any] | None = None,
-    ):
-
-        kwargs = {
-            'level': self.level.value,
-            'path': self.path,
-            'method': self.method,
-            'headers': ', '.join([
-                f'{key}:{header}' for key, header in self.headers.items()
-            ]),
-            'params': ', '.join([
-                f'{key}:{header}' for key, header in self.headers.items()
-            ]),
-            'query': self.query,
-            'body': self.body,
-            'error': self.error,
-            'ip_address': self.ip_address,
-        }
+    def _template_value(self, field: str) -> Any:
+        if field == 'headers':
+            return _join_pairs(self.headers)
 
-        if context:
-            kwargs.update(context)
-
-        return template.format(**kwargs)
+        elif field == 'params':
+            return _join_pairs(self.params)
 
+        return super()._template_value(field)
 
 
 class Response(Entry, kw_only=True):
@@ -58,20 +47,9 @@ class Response(Entry, kw_only=True):
     ip_address: str | None = None
     status: int | None = None
 
-    def to_template(
-        self,
-        template: str,
-        context: Dict[str, Any] | None = None,
-    ):
-        kwargs: Dict[
-            str,
-            int | str | bool | float | LogLevel | list | dict | set | Any,
-        ] = {field: getattr(self, field) for field in self.__struct_fields__ if getattr(self, field) is not None}
-
-        kwargs["level"] = kwargs["level"].value
-
-        if context:
-            kwargs.update(context)
-
-        return template.format(**kwargs)
+    def _template_value(self, field: str) -> Any:
+        value = super()._template_value(field)
 
+        # Unset fields (i.e. error on a successful response) are left
+        # blank rather than rendered as "None".
+        return '' if value is None else value
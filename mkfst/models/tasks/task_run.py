@@ -1,9 +1,9 @@
 import time
 from typing import Any, Optional
 
-import orjson
 from pydantic import (
     BaseModel,
+    Field,
     StrictFloat,
     StrictInt,
     StrictStr,
@@ -11,34 +11,36 @@ from pydantic import (
 
 from .run_status import RunStatus
 
+TASK_RUN_DATA_FIELDS = {
+    'run_id',
+    'status',
+    'error',
+    'start',
+    'end',
+    'elapsed',
+}
+
 
 class TaskRun(BaseModel):
     run_id: StrictInt
     status: RunStatus
     error: Optional[StrictStr]=None
     trace: Optional[StrictStr]=None
-    start: StrictInt | StrictFloat = time.monotonic()
+    start: StrictInt | StrictFloat = Field(default_factory=time.monotonic)
     end: Optional[StrictInt | StrictFloat] = None
     elapsed: StrictInt | StrictFloat = 0
     result: Optional[Any] = None
 
     def to_json(self):
-
-        return orjson.dumps({
-            'run_id': self.run_id,
-            'status': self.status.value,
-            'error': self.error,
-            'start': self.start,
-            'end': self.end,
-            'elapsed': self.elapsed
-        })
+        # Serialize straight from the model instead of building a dict
+        # for orjson to walk a second time.
+        return self.__pydantic_serializer__.to_json(
+            self,
+            include=TASK_RUN_DATA_FIELDS,
+        )
     
     def to_data(self):
-        return {
-            'run_id': self.run_id,
-            'status': self.status.value,
-            'error': self.error,
-            'start': self.start,
-            'end': self.end,
-            'elapsed': self.elapsed
-        }
\ No newline at end of file
+        return self.model_dump(
+            mode='json',
+            include=TASK_RUN_DATA_FIELDS,
+        )
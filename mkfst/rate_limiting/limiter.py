@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 from pydantic import IPvAnyAddress
 
@@ -64,10 +64,14 @@ class Limiter:
             "token-bucket": TokenBucketLimiter,
         }
 
+        self._default_limiter_class = self._rate_limiter_types.get(
+            self._default_limiter_type
+        )
+
         self._rate_limit_period = env.MERCURY_SYNC_HTTP_RATE_LIMIT_PERIOD
 
         self._rate_limiters: Dict[
-            str,
+            str | Tuple[str, IPvAnyAddress],
             Union[
                 AdaptiveRateLimiter,
                 CPUAdaptiveLimiter,
@@ -77,8 +81,91 @@ class Limiter:
             ],
         ] = {}
 
+        # The strategy is fixed for the limiter's lifetime, so pick its
+        # key builder once rather than comparing strategies per request.
+        self._get_limit_key: Callable[
+            [Limit, str, str, IPvAnyAddress],
+            Tuple[Union[str, Tuple[str, IPvAnyAddress], None], Limit],
+        ] = {
+            "ip": self._get_ip_key,
+            "endpoint": self._get_endpoint_key,
+            "global": self._get_global_key,
+            "ip-endpoint": self._get_ip_endpoint_key,
+        }.get(self._rate_limit_strategy, self._get_key)
+
         self._logger = Logger()
 
+    def _get_ip_key(
+        self,
+        limit: Limit,
+        path: str,
+        method: str,
+        ip_address: IPvAnyAddress,
+    ):
+        return limit.get_key(
+            path,
+            method, 
+            ip_address, 
+            default=ip_address
+        ), limit
+
+    def _get_endpoint_key(
+        self,
+        limit: Limit,
+        path: str,
+        method: str,
+        ip_address: IPvAnyAddress,
+    ):
+        return limit.get_key(
+            path,
+            method, 
+            ip_address, 
+            default=path
+        ), limit
+
+    def _get_global_key(
+        self,
+        limit: Limit,
+        path: str,
+        method: str,
+        ip_address: IPvAnyAddress,
+    ):
+        return self._default_limit.get_key(
+            path, 
+            method, 
+            ip_address, 
+            default="default",
+        ), self._default_limit
+
+    def _get_ip_endpoint_key(
+        self,
+        limit: Limit,
+        path: str,
+        method: str,
+        ip_address: IPvAnyAddress,
+    ):
+        # Key on the pair itself rather than formatting a new string
+        # for every request.
+        return limit.get_key(
+            path,
+            method, 
+            ip_address, 
+            default=(path, ip_address)
+        ), limit
+
+    def _get_key(
+        self,
+        limit: Limit,
+        path: str,
+        method: str,
+        ip_address: IPvAnyAddress,
+    ):
+        return limit.get_key(
+            path, 
+            method, 
+            ip_address,
+        ), limit
+
     async def limit(
         self, 
         ip_address: IPvAnyAddress, 
@@ -86,120 +173,70 @@ class Limiter:
         method: str, 
         limit: Optional[Limit] = None
     ):
-        async with self._logger.context(
-            template="{timestamp} - {level} - {thread_id} - {message}",
-        ) as ctx:
-            
-            rejected = False
-            limit_type = limit.limiter_type if limit else self._default_limiter_type
+        rejected = False
+        limit_type = limit.limiter_type if limit else self._default_limiter_type
 
-            if limit is None:
-                limit = self._default_limit
-            
-            await ctx.log(Event(
-                level=LogLevel.DEBUG,
-                message=f'Request - {method} {path}:{str(ip_address)} - Using {limit_type} rate limiter with strategy - {self._rate_limit_strategy}'
-            ))
-            
-            limit_key: Union[str, None] = None
-
-            if self._rate_limit_strategy == "ip":
-                limit_key = limit.get_key(
-                    path,
-                    method, 
-                    ip_address, 
-                    default=ip_address
-                )
+        if limit is None:
+            limit = self._default_limit
 
-            elif self._rate_limit_strategy == "endpoint":
-                limit_key = limit.get_key(
-                    path,
-                    method, 
-                    ip_address, 
-                    default=path
-                )
-
-            elif self._rate_limit_strategy == "global":
-                limit_key = self._default_limit.get_key(
-                    path, 
-                    method, 
-                    ip_address, 
-                    default="default",
-                )
+        limit_key, limit = self._get_limit_key(
+            limit,
+            path,
+            method,
+            ip_address,
+        )
 
-                limit = self._default_limit
+        checked = bool(limit_key) and limit.matches(
+            path,
+            method, 
+            ip_address,
+        )
 
-            elif self._rate_limit_strategy == "ip-endpoint":
-                limit_key = limit.get_key(
-                    path,
-                    method, 
-                    ip_address, 
-                    default=f"{path}_{ip_address}"
-                )
+        if checked:
+            limiter = self._rate_limiters.get(limit_key)
 
-            elif limit:
-                limit_key = limit.get_key(
-                    path, 
-                    method, 
-                    ip_address,
+            if limiter is None:
+                limiter_class = (
+                    self._rate_limiter_types.get(limit.limiter_type)
+                    if limit.limiter_type is not None
+                    else self._default_limiter_class
                 )
 
-            if limit_key and limit.matches(
-                path,
-                method, 
-                ip_address,
-            ):
-                rejected = await self._check_limiter(
-                    limit_key, 
-                    limit,
-                    path,
-                    method,
-                    ip_address,
-                )
+                limiter = limiter_class(limit)
 
-            if rejected:
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {method} {path}:{str(ip_address)} - Request rejected by {limit.limiter_type} using strategy {self._rate_limit_strategy}'
-                ))
+                self._rate_limiters[limit_key] = limiter
 
-            else:
-                await ctx.log(Event(
-                    level=LogLevel.DEBUG,
-                    message=f'Request - {method} {path}:{str(ip_address)} - Request accepted by {limit.limiter_type} using strategy {self._rate_limit_strategy}'
-                ))
+            rejected = await limiter.acquire()
 
+        # Every request passes through here, and all of its logging is
+        # debug level - skip the logging context (and formatting the
+        # messages) entirely unless debug logging is on.
+        if not self._logger.enabled(LogLevel.DEBUG):
             return rejected
 
-    async def _check_limiter(
-        self, 
-        limiter_key: str, 
-        limit: Limit,
-        path: str,
-        method: str,
-        ip_address: IPvAnyAddress
-    ):
         async with self._logger.context(
             template="{timestamp} - {level} - {thread_id} - {message}",
         ) as ctx:
-            
+            log_prefix = f'Request - {method} {path}:{ip_address} - '
+
             await ctx.log(Event(
                 level=LogLevel.DEBUG,
-                message=f'Request - {method} {path}:{str(ip_address)} - Checking  {limit.limiter_type} rate limiter with strategy - {self._rate_limit_strategy}'
+                message=log_prefix + f'Using {limit_type} rate limiter with strategy - {self._rate_limit_strategy}'
             ))
-            
-            limiter = self._rate_limiters.get(limiter_key)
 
-            rate_limiter_type = limit.limiter_type
-            if rate_limiter_type is None:
-                rate_limiter_type = self._default_limiter_type
-
-            if limiter is None:
-                limiter = self._rate_limiter_types.get(rate_limiter_type)(limit)
+            if rejected:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + f'Request rejected by {limit.limiter_type} using strategy {self._rate_limit_strategy}'
+                ))
 
-                self._rate_limiters[limiter_key] = limiter
+            else:
+                await ctx.log(Event(
+                    level=LogLevel.DEBUG,
+                    message=log_prefix + f'Request accepted by {limit.limiter_type} using strategy {self._rate_limit_strategy}'
+                ))
 
-            return await limiter.acquire()
+        return rejected
 
     async def close(self):
         for limiter in self._rate_limiters.values():
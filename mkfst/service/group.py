@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import inspect
+import weakref
 from collections import defaultdict
 from typing import (
     Any,
@@ -26,7 +28,6 @@ from mkfst.docs import (
 )
 from mkfst.env import Env
 from mkfst.middleware.base import Middleware
-from mkfst.middleware.base.base_wrapper import BaseWrapper
 from mkfst.models.http import (
     HTML,
     FileUpload,
@@ -44,6 +45,167 @@ Tag = Dict[
 ]
 
 
+# Handler signatures and type hints can't change once their class is
+# defined, so they're looked up once per function and shared by every
+# instance (and every reassembly) of the group or service.
+handler_signatures: weakref.WeakKeyDictionary[
+    Callable[..., Any],
+    inspect.Signature,
+] = weakref.WeakKeyDictionary()
+handler_return_types: weakref.WeakKeyDictionary[
+    Callable[..., Any],
+    Any,
+] = weakref.WeakKeyDictionary()
+
+
+def get_handler_signature(handler: Callable[..., Any]) -> inspect.Signature:
+    if not inspect.ismethod(handler):
+        return inspect.signature(handler)
+
+    # Keyed on the underlying function, with the signature of the bound
+    # method (i.e. without self).
+    try:
+        return handler_signatures[handler.__func__]
+
+    except KeyError:
+        handler_signature = inspect.signature(handler)
+        handler_signatures[handler.__func__] = handler_signature
+
+        return handler_signature
+
+
+def get_handler_return_type(handler: Callable[..., Any]) -> Any:
+    func = getattr(handler, '__func__', handler)
+
+    try:
+        return handler_return_types[func]
+
+    except KeyError:
+        return_type = get_type_hints(func).get('return')
+        handler_return_types[func] = return_type
+
+        return return_type
+
+
+@functools.lru_cache(maxsize=256)
+def get_hook_names(cls: type) -> Tuple[str, ...]:
+    # Endpoints and tasks are marked on the functions in the class
+    # bodies, so only those need resolving on an instance - not every
+    # attribute inspect.getmembers() would fetch.
+    return tuple(sorted({
+        name
+        for base in cls.__mro__
+        for name, attr in vars(base).items()
+        if hasattr(attr, "as_endpoint") or hasattr(attr, "as_task")
+    }))
+
+
+def get_hooks(instance: Any) -> List[Callable[..., Any]]:
+    hooks: List[Callable[..., Any]] = []
+    for name in get_hook_names(type(instance)):
+        hook = getattr(instance, name)
+        if inspect.ismethod(hook):
+            hooks.append(hook)
+
+    return hooks
+
+
+def get_response_parser(
+    return_type: Any,
+    responses: Dict[int, Any] | None,
+    model_types: frozenset,
+) -> Tuple[Any, int] | None:
+    response_types = get_args(return_type)
+    response_parser: Tuple[Any, int] | None = None
+
+    if (
+        len(response_types) > 1
+        and inspect.isclass(response_types[0])
+        and response_types[0] in model_types
+    ):
+        response_parser = (
+            response_types[0],
+            response_types[1]
+        )
+
+    elif len(response_types) > 0 and response_types[0] in model_types:
+        response_parser = (
+            response_types[0],
+            200
+        )
+
+    elif return_type in model_types or (
+        inspect.isclass(return_type) and issubclass(
+            return_type,
+            BaseModel
+        )
+    ) or return_type in (
+        dict,
+        list,
+        HTML,
+        FileUpload,
+    ):
+        response_parser = (
+            return_type,
+            200
+        )
+
+    # Explicitly declared responses take precedence over the handler's
+    # return annotation.
+    if isinstance(responses, dict):
+        for status, response_model in responses.items():
+            if issubclass(response_model, BaseModel):
+                response_parser = (
+                    response_model,
+                    status
+                )
+
+    return response_parser
+
+
+def get_documented_responses(
+    return_type: Any,
+    responses: Dict[int, Any] | None,
+    model_types: frozenset,
+) -> Dict[int, Any]:
+    response_types = get_args(return_type)
+    documented: Dict[int, Any] = {}
+
+    if (
+        len(response_types) > 1
+        and inspect.isclass(response_types[0])
+        and response_types[0] in model_types
+    ):
+        documented[response_types[1]] = response_types[0]
+
+    elif len(response_types) == 1 or (
+        len(response_types) > 0 and response_types[0] in model_types
+    ):
+        documented[200] = response_types[0]
+
+    else:
+        documented[200] = return_type
+
+    if isinstance(responses, dict):
+        documented.update(responses)
+
+    return documented
+
+
+def extend_middleware(
+    middleware: List[Middleware],
+    additional: List[Middleware],
+):
+    # Middleware are the same only if they're the same instance, so
+    # skip duplicates by id rather than scanning the list for each one.
+    seen = {id(existing) for existing in middleware}
+
+    for added in additional:
+        if id(added) not in seen:
+            seen.add(id(added))
+            middleware.append(added)
+
+
 def join_paths(*paths: str):
     joined = '/'.join([
         path.strip('/') for path in paths
@@ -92,11 +254,17 @@ class Group:
         instance_id: int,
         env: Env,
         parent_middleware: List[Middleware],
+        prefix: str | None = None,
     ):
+        # Nested groups are mounted under their parent's full path, which
+        # is passed down rather than written back into each child's base
+        # (so assembling the same groups again doesn't prefix them twice).
+        base = self._base if prefix is None else join_paths(prefix, self._base)
         
-        self._middleware.extend([
-            middleware for middleware in parent_middleware if middleware not in self._middleware
-        ])
+        extend_middleware(
+            self._middleware,
+            parent_middleware,
+        )
         
         task_runner = TaskRunner(
             instance_id,
@@ -116,117 +284,31 @@ class Group:
             ]
         ] = {}
     
-        request_parsers: Dict[str, BaseModel] = {}
-        response_parsers: Dict[BaseModel, Tuple[Callable[[Any], str], int]] = {}
-
-        middleware_enabled: Dict[str, bool] = {}
-        
-        routes: Dict[
-            str,
-            Dict[
-                str,
-                Callable[
-                    ...,
-                    Awaitable[Any]
-                ]
-            ]
-        ] = {}
-        
         (
             endpoints, 
             tasks, 
             fabricators,
             endpoint_docs,
             response_headers,
-        ) = self._gather_hooks()
+            routes,
+            request_parsers,
+            response_parsers,
+            middleware_enabled,
+        ) = self._gather_hooks(base)
 
         for task in tasks.values():
             task_runner.add(task)
 
-        for path, endpoint in endpoints.items():
-
-            handler = endpoint
-            has_middleware = len(self._middleware) > 0
-            if has_middleware:
-                middleware_enabled[path] = True
-
-            if isinstance(endpoint, (Middleware, BaseWrapper)):
-                handler = self._handlers[path]
-
-            endpoint_signature = inspect.signature(handler)
-            params = endpoint_signature.parameters.values()
-
-            return_type = get_type_hints(handler).get('return')
-            response_types = get_args(return_type)
-
-            request_parsers.update({
-                path: get_args(
-                    param_type.annotation
-                )[0] for param_type in params if (
-                    (args := get_args(param_type.annotation)) and
-                    len(args) > 0 and
-                    args[0] in BaseModel.__subclasses__()
-                )
-            })
-
-            routes[handler.path] = {
-                method: endpoint for method in handler.methods
-            }
-            
-            if (
-                len(response_types) > 1
-                and inspect.isclass(response_types[0])
-                and response_types[0] in BaseModel.__subclasses__()
-            ):
-                model = response_types[0]
-                status_code = response_types[1]
-
-                response_parsers[path] = (
-                    model,
-                    status_code
-                )
-
-            elif len(response_types) > 0 and response_types[0] in BaseModel.__subclasses__():
-                model = response_types[0]
-
-                response_parsers[path] = (
-                    model,
-                    200
-                )
-
-            elif return_type in BaseModel.__subclasses__() or return_type in [
-                HTML,
-                FileUpload
-            ]:            
-                response_parsers[path] = (
-                    return_type,
-                    200
-                )
-
-            if isinstance(handler.responses, dict):
-                responses = handler.responses
-
-                response_parsers.update({
-                    path: (
-                        response_model,
-                        status
-                    ) for status, response_model in responses.items() if (
-                        issubclass(response_model, BaseModel)
-                    )
-                })
-
         parsers.update(request_parsers)
         parsers.update(response_parsers)
 
         events.update(endpoints)
         match_routes.update(routes)
 
-        for group in self._groups:
-            group._base = join_paths(self._base, group._base)
-
         assembled_groups = self._gather_groups(
             instance_id,
             env,
+            base,
         )
 
         group_middleware = list(self._middleware)
@@ -243,9 +325,10 @@ class Group:
             fabricators.update(assembled["fabricators"])
             endpoint_docs.update(assembled["endpoint_docs"])
             response_headers.update(assembled['response_headers'])
-            group_middleware.extend([
-                middleware for middleware in assembled['middleware'] if middleware not in self._middleware
-            ])
+            extend_middleware(
+                group_middleware,
+                assembled['middleware'],
+            )
 
         return {
             'routes': routes,
@@ -262,7 +345,10 @@ class Group:
             'response_headers': response_headers
         }
 
-    def _gather_hooks(self):
+    def _gather_hooks(
+        self,
+        base: str,
+    ):
 
         reserved = ["connect", "close"]
         endpoints: Dict[
@@ -276,8 +362,27 @@ class Group:
         fabricators: Dict[str, Fabricator] = {}
         endpoint_docs: Dict[str, ParsedEndpoint] = {}
         response_headers: Dict[str, Dict[str, Any]] = {}
+        routes: Dict[
+            str,
+            Dict[
+                str,
+                Callable[
+                    ...,
+                    Awaitable[Any]
+                ]
+            ]
+        ] = {}
+        request_parsers: Dict[str, BaseModel] = {}
+        response_parsers: Dict[str, Tuple[Any, int]] = {}
+        middleware_enabled: Dict[str, bool] = {}
+
+        has_middleware = len(self._middleware) > 0
 
-        for _, call in inspect.getmembers(self, predicate=inspect.ismethod):
+        # Membership checks against a set, rather than rebuilding and
+        # scanning the subclass list for every check.
+        model_types = frozenset(BaseModel.__subclasses__())
+
+        for call in get_hooks(self):
 
             hook_name: str = call.__name__
             not_internal = hook_name.startswith("__") is False
@@ -294,21 +399,27 @@ class Group:
                 for middleware_operator in self._middleware:
                     call = middleware_operator.wrap(call)
 
-                endpoint_path = join_paths(self._base, path)
+                endpoint_path = join_paths(base, path)
+
+                # Every per-method table below is keyed the same way, so
+                # build the keys once.
+                endpoint_keys = [
+                    f'{method}_{endpoint_path}' for method in methods
+                ]
 
                 endpoints.update({
-                    f'{method}_{endpoint_path}': call for method in methods
+                    endpoint_key: call for endpoint_key in endpoint_keys
                 })
 
                 self._handlers.update({
-                    f'{method}_{endpoint_path}': handler for method in methods
+                    endpoint_key: handler for endpoint_key in endpoint_keys
                 })
 
-                call_params = inspect.signature(handler).parameters
+                call_params = get_handler_signature(handler).parameters
 
-                required_params = [
+                required_params = tuple(
                     (key, value.annotation) for key, value in call_params.items() if value.default == inspect._empty
-                ]
+                )
 
                 optional_params = {
                     key: get_args(value.annotation) for key, value in call_params.items() if value.default != inspect._empty
@@ -318,34 +429,32 @@ class Group:
                     required_params,
                     optional_params
                 )
-                
-                return_type = get_type_hints(handler).get('return')
-                response_types = get_args(return_type)
-
-                responses: Dict[int, Any] = {}
-                
-                if (
-                    len(response_types) > 1
-                    and inspect.isclass(response_types[0])
-                    and response_types[0] in BaseModel.__subclasses__()
-                ):
-                    model = response_types[0]
-                    status_code = response_types[1]
-
-                    responses[status_code] = model
 
-                elif len(response_types) == 1:
-                    responses[200] = response_types[0]
-
-                elif len(response_types) > 0 and response_types[0] in BaseModel.__subclasses__():
-                    model = response_types[0]
-                    responses[200] = model
-
-                else:
-                    responses[200] = return_type
+                # Parsers and routes are resolved here, alongside the
+                # docs, rather than in a second pass over the endpoints.
+                request_parser: BaseModel | None = None
+                for param in call_params.values():
+                    args = get_args(param.annotation)
+                    if len(args) > 0 and args[0] in model_types:
+                        request_parser = args[0]
+
+                declared_responses = handler.responses
+                return_type = get_handler_return_type(handler)
+                response_parser = get_response_parser(
+                    return_type,
+                    declared_responses,
+                    model_types,
+                )
 
-                if isinstance(handler.responses, dict):
-                    responses.update(handler.responses)
+                routes[path] = {
+                    method: call for method in methods
+                }
+                
+                responses = get_documented_responses(
+                    return_type,
+                    declared_responses,
+                    model_types,
+                )
 
                 additional_docs: Dict[   
                     Literal[
@@ -383,10 +492,13 @@ class Group:
                     ]
                 ] = handler.method_metadata
 
+                # The connection only ever reads these (per-request headers
+                # are merged into a new dict), so every method can share
+                # the one copy.
                 call_response_headers = dict(handler.response_headers)
                 response_headers.update({
-                    f'{method}_{endpoint_path}': dict(handler.response_headers) for method in methods
-                }) 
+                    endpoint_key: call_response_headers for endpoint_key in endpoint_keys
+                })
 
                 endpoint_docs[endpoint_path] = ParsedEndpoint(
                     path=endpoint_path,
@@ -419,9 +531,17 @@ class Group:
                     required=fabricator.required_params
                 )
 
-                for method in methods:
-                    endpoint_method_key = f'{method}_{endpoint_path}'
-                    fabricators[endpoint_method_key] = fabricator
+                for endpoint_key in endpoint_keys:
+                    fabricators[endpoint_key] = fabricator
+
+                    if has_middleware:
+                        middleware_enabled[endpoint_key] = True
+
+                    if request_parser:
+                        request_parsers[endpoint_key] = request_parser
+
+                    if response_parser:
+                        response_parsers[endpoint_key] = response_parser
 
                 self._supported_handlers[endpoint_path] = {
                     method: handler for method in methods
@@ -437,12 +557,17 @@ class Group:
             fabricators,
             endpoint_docs,
             response_headers,
+            routes,
+            request_parsers,
+            response_parsers,
+            middleware_enabled,
         )
     
     def _gather_groups(
         self,
         instance_id: int,
-        env: Env
+        env: Env,
+        base: str,
     ) -> List[
         Dict[
             Literal[
@@ -466,6 +591,7 @@ class Group:
             group._assemble(
                 instance_id,
                 env,
-                self._middleware
+                self._middleware,
+                prefix=base,
             ) for group in self._groups
         ]
\ No newline at end of file
@@ -11,7 +11,6 @@ import socket
 import sys
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from inspect import signature
 from typing import (
         Any,
         Awaitable,
@@ -26,7 +25,6 @@ from typing import (
         TypeVar,
         Union,
         get_args,
-        get_type_hints,
 )
 
 from pydantic import BaseModel
@@ -51,12 +49,19 @@ from mkfst.env import Env, load_env
 from mkfst.hooks import endpoint
 from mkfst.logging import Logger
 from mkfst.middleware.base import Middleware
-from mkfst.middleware.base.base_wrapper import BaseWrapper
 from mkfst.models.http import HTML, FileUpload
 from mkfst.models.logging import Event
 from mkfst.tasks import TaskRunner
 
-from .group import Group
+from .group import (
+        Group,
+        extend_middleware,
+        get_documented_responses,
+        get_handler_return_type,
+        get_handler_signature,
+        get_hooks,
+        get_response_parser,
+)
 from .socket import bind_tcp_socket
 
 E = TypeVar('E', bound=Env)
@@ -524,128 +529,25 @@ class Service(Generic[E]):
         self._tcp._response_headers.update(assembled['response_headers'])
         self._endpoint_docs.update(assembled["endpoint_docs"])
         
-        self._group_middleware.extend([
-            middleware for middleware in assembled['middleware'] if middleware not in self._group_middleware
-        ])
+        extend_middleware(
+            self._group_middleware,
+            assembled['middleware'],
+        )
 
     def _setup(self):
-    
-        response_parsers: Dict[BaseModel, Tuple[Callable[[Any], str], int]] = {}
-        request_parsers: Dict[str, BaseModel] = {}
-
-        routes = {}
         
         (
             endpoints, 
             tasks, 
             fabricators,
+            routes,
+            request_parsers,
+            response_parsers,
         ) = self._gather_hooks()
 
         for task in tasks.values():
             self.tasks.add(task)
 
-        for path, path_endpoint in endpoints.items():
-
-            handler = path_endpoint
-            has_middleware = len(self.middleware) > 0
-            if has_middleware and handler.path not in self._reserved_urls:
-                self._tcp._middleware_enabled[path] = True
-
-            if isinstance(path_endpoint, (Middleware, BaseWrapper)):
-                handler = self._handlers.get(path)
-
-            endpoint_signature = signature(handler)
-            params = endpoint_signature.parameters.values()
-
-            return_type = get_type_hints(handler).get('return')
-            response_types = get_args(return_type)
-
-            request_parsers.update({
-                path: get_args(
-                    param_type.annotation
-                )[0] for param_type in params if (
-                    (args := get_args(param_type.annotation)) and
-                    len(args) > 0 and
-                    args[0] in BaseModel.__subclasses__()
-                )
-            })
-
-            routes[handler.path] = {
-                method: path_endpoint for method in handler.methods
-            }
-
-            methods = handler.methods
-            
-            if (
-                len(response_types) > 1
-                and inspect.isclass(response_types[0])
-                and response_types[0] in BaseModel.__subclasses__()
-            ):
-                model = response_types[0]
-                status_code = response_types[1]
-
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        model,
-                        status_code
-                    ) for method in methods
-                })
-
-            elif len(response_types) > 0 and response_types[0] in BaseModel.__subclasses__():
-                model = response_types[0]
-
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        model,
-                        200
-                    ) for method in methods
-                })
-
-            elif return_type and return_type in BaseModel.__subclasses__() or (
-                inspect.isclass(return_type) and issubclass(
-                    return_type,
-                    BaseModel
-                )
-            ):
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        return_type,
-                        200
-                    ) for method in methods
-                })
-
-            elif return_type is dict or return_type is list:
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        return_type,
-                        200
-                    ) for method in methods
-                })
-
-            elif return_type and return_type in BaseModel.__subclasses__() or return_type in [
-                HTML,
-                FileUpload
-            ]:                
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        return_type,
-                        200
-                    ) for method in methods
-                })
-
-            
-            if isinstance(handler.responses, dict):
-                responses = handler.responses
-
-                response_parsers.update({
-                    f'{method}_{handler.path}': (
-                        response_model,
-                        status
-                    ) for method in methods for status, response_model in responses.items() if (
-                        issubclass(response_model, BaseModel)
-                    )
-                })
-
         self._tcp.parsers.update(request_parsers)
         self._tcp.parsers.update(response_parsers)
 
@@ -673,8 +575,14 @@ class Service(Generic[E]):
         ] = {}
         fabricators: Dict[str, Fabricator] = {}
         tasks: Dict[str, Callable[[], Awaitable[Any]]] = {} 
+        routes: Dict[str, Dict[str, Callable[..., Awaitable[Any]]]] = {}
+        request_parsers: Dict[str, BaseModel] = {}
+        response_parsers: Dict[str, Tuple[Any, int]] = {}
 
-        for _, call in inspect.getmembers(self, predicate=inspect.ismethod):
+        has_middleware = len(self.middleware) > 0
+        model_types = frozenset(BaseModel.__subclasses__())
+
+        for call in get_hooks(self):
 
             hook_name: str = call.__name__
             not_internal = hook_name.startswith("__") is False
@@ -690,23 +598,28 @@ class Service(Generic[E]):
                 path: str = call.path
 
                 handler = call
-                for middleware_operator in self.middleware:
-                    if path not in self._reserved_urls:
+                is_reserved = path in self._reserved_urls
+                if not is_reserved:
+                    for middleware_operator in self.middleware:
                         call = middleware_operator.wrap(call)
                 
+                endpoint_keys = [
+                    f'{method}_{path}' for method in methods
+                ]
+
                 endpoints.update({
-                    f'{method}_{path}': call for method in methods
+                    endpoint_key: call for endpoint_key in endpoint_keys
                 })
 
                 self._handlers.update({
-                    f'{method}_{path}': handler for method in methods
+                    endpoint_key: handler for endpoint_key in endpoint_keys
                 })
 
-                call_params = inspect.signature(handler).parameters
+                call_params = get_handler_signature(handler).parameters
 
-                required_params = [
+                required_params = tuple(
                     (key, value.annotation) for key, value in call_params.items() if value.default == inspect._empty
-                ]
+                )
 
                 optional_params = {
                     key: get_args(value.annotation) for key, value in call_params.items() if value.default != inspect._empty
@@ -717,33 +630,29 @@ class Service(Generic[E]):
                     optional_params
                 )
 
-                return_type = get_type_hints(handler).get('return')
-                response_types = get_args(return_type)
+                request_parser: BaseModel | None = None
+                for param in call_params.values():
+                    args = get_args(param.annotation)
+                    if len(args) > 0 and args[0] in model_types:
+                        request_parser = args[0]
 
-                responses: Dict[int, Any] = {}
-                
-                if (
-                    len(response_types) > 1
-                    and inspect.isclass(response_types[0])
-                    and response_types[0] in BaseModel.__subclasses__()
-                ):
-                    model = response_types[0]
-                    status_code = response_types[1]
-
-                    responses[status_code] = model
-
-                elif len(response_types) == 1:
-                    responses[200] = response_types[0]
-
-                elif len(response_types) > 0 and response_types[0] in BaseModel.__subclasses__():
-                    model = response_types[0]
-                    responses[200] = model
+                declared_responses = handler.responses
+                return_type = get_handler_return_type(handler)
+                response_parser = get_response_parser(
+                    return_type,
+                    declared_responses,
+                    model_types,
+                )
 
-                else:
-                    responses[200] = return_type
+                routes[path] = {
+                    method: call for method in methods
+                }
 
-                if isinstance(handler.responses, dict):
-                    responses.update(handler.responses)
+                responses = get_documented_responses(
+                    return_type,
+                    declared_responses,
+                    model_types,
+                )
 
                 additional_docs: Dict[   
                     Literal[
@@ -783,10 +692,10 @@ class Service(Generic[E]):
                 call_response_headers = dict(handler.response_headers)
 
                 self._response_headers.update({
-                    f'{method}_{path}': dict(call_response_headers) for method in methods
+                    endpoint_key: call_response_headers for endpoint_key in endpoint_keys
                 })
                 
-                if path not in self._reserved_urls:
+                if not is_reserved:
                     self._endpoint_docs[path] = ParsedEndpoint(
                         path=path,
                         methods=methods,
@@ -815,9 +724,17 @@ class Service(Generic[E]):
                         required=fabricator.required_params
                     )
                     
-                for method in methods:
-                    endpoint_method_key = f'{method}_{path}'
-                    fabricators[endpoint_method_key] = fabricator
+                for endpoint_key in endpoint_keys:
+                    fabricators[endpoint_key] = fabricator
+
+                    if has_middleware and not is_reserved:
+                        self._tcp._middleware_enabled[endpoint_key] = True
+
+                    if request_parser:
+                        request_parsers[endpoint_key] = request_parser
+
+                    if response_parser:
+                        response_parsers[endpoint_key] = response_parser
 
                 self._tcp._supported_handlers[path] = {
                     method: handler for method in methods
@@ -830,7 +747,10 @@ class Service(Generic[E]):
         return (
             endpoints,
             tasks,
-            fabricators
+            fabricators,
+            routes,
+            request_parsers,
+            response_parsers,
         )
 
     async def run_forever(self):
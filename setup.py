@@ -43,5 +43,16 @@ setup(
         "orjson",
         "msgspec",
     ],
+    extras_require={
+        "deflate": [
+            "deflate",
+        ],
+        "isal": [
+            "isal",
+        ],
+        "pybase64": [
+            "pybase64",
+        ],
+    },
     python_requires=">=3.11",
 )